@@ -6,17 +6,72 @@ import logging
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import json
+import re
 import concurrent.futures
 from contextlib import contextmanager
-import pymysql
 
 from .config import config
-from .database import DatabaseManager
+from .database import DatabaseManager, db_driver
 from .llm_client import call_llm, get_report_model_names, LLMClient
 from .notion_client import get_notion_client
 
 logger = logging.getLogger(__name__)
 
+# 解析逐条LLM响应时使用的正则，模块加载时编译一次：```json 代码块中的对象、最外层花括号
+_JSON_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*({.*?})\s*```', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# 单篇文章深度分析的固定指南与输出格式，作为system消息发送；
+# 文章正文放在随后的user消息中，所有调用共享相同的前缀，可命中服务端的提示词缓存
+SINGLE_ARTICLE_SYSTEM_PROMPT = """你是一位顶尖的独立开发者社区分析师和创业导师。你的任务是深入分析用户消息中给出的文章，并以结构化的JSON格式，提炼出其中所有有价值的信息。
+
+请严格按照"事实层"、"观察层"、"思考层"三个维度进行分析，并遵循最终的JSON输出格式。
+
+**分析维度指南:**
+
+1.  **事实层 (Factual Layer)**: 客观地提取文章明确提到的信息。
+    *   `article_type`: 判断文章类型，从 ['经验分享', '案例研究', '技术教程', '观点讨论', '产品发布', '问答'] 中选择一个最贴切的。
+    *   `summary`: 用200字左右总结文章的核心内容。
+    *   `key_entities`: 提取文章中提到的关键实体，如产品名、公司名、技术栈、关键人物等。
+
+2.  **观察层 (Observational Layer)**: 提炼作者的核心观点和可直接复用的信息。
+    *   `core_insights`: 总结作者的核心洞察或主要论点，以列表形式呈现。
+    *   `actionable_playbook`: 提炼出具体的、可操作的步骤或策略。如果没有，则返回空数组。
+    *   `quantitative_results`: 提取所有能量化的结果，如"月收入达到$10,000"、"用户增长50%"、"转化率从1%提升到5%"等。
+
+3.  **思考层 (Deeper Analysis Layer)**: 进行批判性思考和延伸分析。
+    *   `underlying_reason`: 分析作者成功的潜在原因或其观点背后的深层逻辑是什么？
+    *   `limitations_and_caveats`: 这些经验或观点有什么局限性、适用前提或潜在风险？
+    *   `sparks_of_inspiration`: 这篇文章最能激发思考或带来启发的一点是什么？
+
+**你的输出必须是一个单一、有效的JSON对象**，并严格遵循以下结构。所有内容值都必须是**中文**：
+{
+  "factual_layer": {
+    "article_type": "经验分享",
+    "summary": "文章的核心内容摘要。",
+    "key_entities": ["产品名", "技术栈", "人物A"]
+  },
+  "observational_layer": {
+    "core_insights": [
+      "核心洞察或论点一。",
+      "核心洞点或论点二。"
+    ],
+    "actionable_playbook": [
+      "第一步：做什么。",
+      "第二步：做什么。"
+    ],
+    "quantitative_results": [
+      "月收入达到 $XXXX",
+      "用户数从 Y 增长到 Z"
+    ]
+  },
+  "deeper_analysis_layer": {
+    "underlying_reason": "作者成功的关键可能在于其独特的市场切入点，而非仅仅是营销技巧。",
+    "limitations_and_caveats": "此方法高度依赖于作者的个人品牌，对于没有粉丝基础的初学者可能不适用。",
+    "sparks_of_inspiration": "将一个看似饱和的市场进行垂直细分，仍然能找到蓝海机会。"
+  }
+}"""
+
 
 class DataAnalyzer:
     """数据分析器，负责RSS数据的智能处理"""
@@ -45,7 +100,7 @@ class DataAnalyzer:
         """
         try:
             with self.db_manager.get_connection() as conn:
-                with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+                with conn.cursor(db_driver.cursors.DictCursor) as cursor:
                     # 开始事务
                     conn.begin()
                     
@@ -165,14 +220,12 @@ class DataAnalyzer:
             
             # 解析JSON响应
             try:
-                import re
-                
                 # 从响应中提取JSON内容
                 content = response['content'].strip()
                 product_info = None
                 
                 # 方案1：尝试找到JSON代码块（被```json包围）
-                json_match = re.search(r'```(?:json)?\s*({.*?})\s*```', content, re.DOTALL)
+                json_match = _JSON_CODE_BLOCK_RE.search(content)
                 if json_match:
                     json_str = json_match.group(1)
                     try:
@@ -679,7 +732,7 @@ class TechNewsAnalyzer:
             for table_name, table_config in tech_tables.items():
                 try:
                     with self.db_manager.get_connection() as conn:
-                        with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+                        with conn.cursor(db_driver.cursors.DictCursor) as cursor:
                             # 根据表的结构构建查询SQL
                             content_field = table_config['content_field']
                             base_fields = table_config['base_fields']
@@ -803,12 +856,11 @@ class TechNewsAnalyzer:
                 return None
             
             # 解析JSON响应
-            import re
             content = response['content'].strip()
             analysis_result = None
             
             # 方案1：尝试找到JSON代码块
-            json_match = re.search(r'```(?:json)?\s*({.*?})\s*```', content, re.DOTALL)
+            json_match = _JSON_CODE_BLOCK_RE.search(content)
             if json_match:
                 json_str = json_match.group(1)
                 try:
@@ -2141,11 +2193,12 @@ class CommunityDeepAnalyzer:
             # 构建分析prompt
             prompt = self._build_single_article_prompt(article.get('full_content', ''))
             
-            # 调用快速模型进行分析
+            # 调用快速模型进行分析：固定指南作为system消息在前，便于服务端前缀缓存
             response = call_llm(
                 prompt=prompt,
                 model_type='fast',
-                temperature=0.3
+                temperature=0.3,
+                system_prompt=SINGLE_ARTICLE_SYSTEM_PROMPT
             )
             
             if not response or not response.get('success'):
@@ -2173,70 +2226,17 @@ class CommunityDeepAnalyzer:
             return None
 
     def _build_single_article_prompt(self, content: str) -> str:
-        """构建单篇文章分析的prompt"""
-        return f"""你是一位顶尖的独立开发者社区分析师和创业导师。你的任务是深入分析给定的文章，并以结构化的JSON格式，提炼出其中所有有价值的信息。
-
-请严格按照"事实层"、"观察层"、"思考层"三个维度进行分析，并遵循最终的JSON输出格式。
-
-**分析维度指南:**
-
-1.  **事实层 (Factual Layer)**: 客观地提取文章明确提到的信息。
-    *   `article_type`: 判断文章类型，从 ['经验分享', '案例研究', '技术教程', '观点讨论', '产品发布', '问答'] 中选择一个最贴切的。
-    *   `summary`: 用200字左右总结文章的核心内容。
-    *   `key_entities`: 提取文章中提到的关键实体，如产品名、公司名、技术栈、关键人物等。
-
-2.  **观察层 (Observational Layer)**: 提炼作者的核心观点和可直接复用的信息。
-    *   `core_insights`: 总结作者的核心洞察或主要论点，以列表形式呈现。
-    *   `actionable_playbook`: 提炼出具体的、可操作的步骤或策略。如果没有，则返回空数组。
-    *   `quantitative_results`: 提取所有能量化的结果，如"月收入达到$10,000"、"用户增长50%"、"转化率从1%提升到5%"等。
-
-3.  **思考层 (Deeper Analysis Layer)**: 进行批判性思考和延伸分析。
-    *   `underlying_reason`: 分析作者成功的潜在原因或其观点背后的深层逻辑是什么？
-    *   `limitations_and_caveats`: 这些经验或观点有什么局限性、适用前提或潜在风险？
-    *   `sparks_of_inspiration`: 这篇文章最能激发思考或带来启发的一点是什么？
-
-**输入文章:**
+        """构建单篇文章分析的用户消息；固定的分析指南见 SINGLE_ARTICLE_SYSTEM_PROMPT"""
+        return f"""**输入文章:**
 '''
 {content}
-'''
-
-**你的输出必须是一个单一、有效的JSON对象**，并严格遵循以下结构。所有内容值都必须是**中文**：
-{{
-  "factual_layer": {{
-    "article_type": "经验分享",
-    "summary": "文章的核心内容摘要。",
-    "key_entities": ["产品名", "技术栈", "人物A"]
-  }},
-  "observational_layer": {{
-    "core_insights": [
-      "核心洞察或论点一。",
-      "核心洞点或论点二。"
-    ],
-    "actionable_playbook": [
-      "第一步：做什么。",
-      "第二步：做什么。"
-    ],
-    "quantitative_results": [
-      "月收入达到 $XXXX",
-      "用户数从 Y 增长到 Z"
-    ]
-  }},
-  "deeper_analysis_layer": {{
-    "underlying_reason": "作者成功的关键可能在于其独特的市场切入点，而非仅仅是营销技巧。",
-    "limitations_and_caveats": "此方法高度依赖于作者的个人品牌，对于没有粉丝基础的初学者可能不适用。",
-    "sparks_of_inspiration": "将一个看似饱和的市场进行垂直细分，仍然能找到蓝海机会。"
-  }}
-}}"""
+'''"""
 
     def _parse_analysis_result(self, response: str) -> Optional[Dict[str, Any]]:
         """解析LLM返回的分析结果"""
         try:
-            # 尝试直接解析JSON
-            import json
-            import re
-            
             # 清理响应文本，提取JSON部分
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
+            json_match = _JSON_OBJECT_RE.search(response)
             if json_match:
                 json_str = json_match.group(0)
                 return json.loads(json_str)
@@ -78,7 +78,11 @@ class Config:
             'database': self._get_config_value('database', 'database', 'DB_NAME', None),
             'port': self._get_config_value('database', 'port', 'DB_PORT', 3306, int),
             'charset': 'utf8mb4',
-            'skip_table_check': self._get_config_value('database', 'skip_table_check', 'DB_SKIP_TABLE_CHECK', True, self._to_bool)
+            'skip_table_check': self._get_config_value('database', 'skip_table_check', 'DB_SKIP_TABLE_CHECK', True, self._to_bool),
+            # 是否启用MySQL协议压缩（远程/跨地域连接时有效，本地连接建议关闭）
+            'compress': self._get_config_value('database', 'compress', 'DB_COMPRESS', False, self._to_bool),
+            # 产品/文章列表查询结果的缓存时间（秒），0 表示不缓存
+            'query_cache_seconds': self._get_config_value('database', 'query_cache_seconds', 'DB_QUERY_CACHE_SECONDS', 300, float)
         }
         
         # 检查SSL模式
@@ -100,18 +104,23 @@ class Config:
             'delay_seconds': self._get_config_value('crawler', 'delay_seconds', 'CRAWLER_DELAY_SECONDS', 2.0, float),
             'max_retries': self._get_config_value('crawler', 'max_retries', 'CRAWLER_MAX_RETRIES', 3, int),
             'timeout_seconds': self._get_config_value('crawler', 'timeout_seconds', 'CRAWLER_TIMEOUT_SECONDS', 30, int),
-            'max_concurrent_requests': self._get_config_value('crawler', 'max_concurrent_requests', 'CRAWLER_MAX_CONCURRENT_REQUESTS', 5, int)
+            'max_concurrent_requests': self._get_config_value('crawler', 'max_concurrent_requests', 'CRAWLER_MAX_CONCURRENT_REQUESTS', 5, int),
+            # 常驻Chromium的CDP地址（如 http://127.0.0.1:9222），为空时每个进程自行启动浏览器
+            'chromium_cdp_endpoint': self._get_config_value('crawler', 'chromium_cdp_endpoint', 'CHROMIUM_CDP_ENDPOINT', None)
         }
     
     def get_data_retention_days(self) -> int:
         """获取数据保留天数，优先级：环境变量 > config.ini > 默认值"""
         return self._get_config_value('data_retention', 'days', 'DATA_RETENTION_DAYS', 30, int)
     
-    def get_logging_config(self) -> Dict[str, str]:
+    def get_logging_config(self) -> Dict[str, Any]:
         """获取日志配置，优先级：环境变量 > config.ini > 默认值"""
         return {
             'log_level': self._get_config_value('logging', 'log_level', 'LOGGING_LOG_LEVEL', 'INFO'),
-            'log_file': self._get_config_value('logging', 'log_file', 'LOGGING_LOG_FILE', 'rss_crawler.log')
+            'log_file': self._get_config_value('logging', 'log_file', 'LOGGING_LOG_FILE', 'rss_crawler.log'),
+            # 日志文件轮转：单个文件的最大字节数与保留的备份数量
+            'log_max_bytes': self._get_config_value('logging', 'log_max_bytes', 'LOGGING_LOG_MAX_BYTES', 10 * 1024 * 1024, int),
+            'log_backup_count': self._get_config_value('logging', 'log_backup_count', 'LOGGING_LOG_BACKUP_COUNT', 5, int)
         }
 
     def get_rsshub_hosts(self) -> List[str]:
@@ -239,6 +248,8 @@ class Config:
             'openai_api_key': openai_api_key,
             'openai_base_url': self._get_config_value('llm', 'openai_base_url', 'OPENAI_BASE_URL', 'https://api.openai.com/v1'),
             'max_content_length': self._get_config_value('llm', 'max_content_length', 'LLM_MAX_CONTENT_LENGTH', 100000, int),
+            # 低温度调用的响应缓存有效期（秒），0 表示关闭
+            'response_cache_seconds': self._get_config_value('llm', 'response_cache_seconds', 'LLM_RESPONSE_CACHE_SECONDS', 3600, int),
         }
     
     def get_fast_model_config(self) -> Dict[str, str]:
@@ -1,25 +1,522 @@
 """
 数据库操作模块
 """
-import pymysql
+try:
+    # 优先使用基于C扩展的 mysqlclient，行解码比纯Python的 PyMySQL 快数倍
+    import MySQLdb as db_driver
+    import MySQLdb.cursors
+    from MySQLdb.constants import CLIENT
+except ImportError:
+    import pymysql as db_driver
+    import pymysql.cursors
+    from pymysql.constants import CLIENT
+try:
+    from dbutils.pooled_db import PooledDB
+except ImportError:
+    PooledDB = None
+try:
+    # 可选：orjson 为C实现的JSON序列化，未安装时回退到标准库 json
+    import orjson
+except ImportError:
+    orjson = None
 import logging
+import threading
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Mapping, Tuple, FrozenSet, Callable, Iterator
+from types import MappingProxyType
 from contextlib import contextmanager
+from collections import defaultdict
+from operator import itemgetter
 import json
+import hashlib
+import math
+import os
+import sys
+import tempfile
+import time
 
 from .config import config
 
 logger = logging.getLogger(__name__)
 
+# 每次 executemany 合并插入的最大行数，避免超过 max_allowed_packet
+INSERT_CHUNK_SIZE = 500
+
+# get_new_guids 每次 IN (...) 查询携带的最大GUID数量
+GUID_FILTER_CHUNK_SIZE = 1000
+
+# get_stats 结果的缓存时间粒度（秒），同一时间段内重复调用直接返回缓存
+STATS_CACHE_SECONDS = 60
+
+# 产品/文章列表查询结果缓存的最大条目数（有效期由 DB_QUERY_CACHE_SECONDS 配置）
+QUERY_CACHE_MAX_ENTRIES = 32
+
+# 清理旧数据时每次 DELETE 的最大行数，以及两次 DELETE 之间的停顿（秒），给并发写入让出锁
+CLEANUP_CHUNK_SIZE = 5000
+CLEANUP_PAUSE_SECONDS = 0.05
+
+# 进程内共享的连接池（首次获取连接时创建）
+_pool = None
+_pool_lock = threading.Lock()
+
+# 元数据查询语句（固定文本，参数只通过占位符传入）
+# 表的估算行数，参数为 (库名, 表名)
+_TABLE_ROWS_SQL = "SELECT table_rows FROM information_schema.tables WHERE table_schema = %s AND table_name = %s"
+# 字段清单，参数为 (库名,)
+_COLUMN_INVENTORY_SQL = "SELECT table_name, column_name, data_type FROM information_schema.columns WHERE table_schema = %s"
+# 索引清单，参数为 (库名,)
+_INDEX_INVENTORY_SQL = "SELECT DISTINCT table_name, index_name FROM information_schema.statistics WHERE table_schema = %s"
+
+# guid的64位哈希：规范化后的guid做SHA-256，取前8字节（大端）转为无符号整数，必须与 _guid_hash 保持一致
+# 规范化（转小写、去掉末尾空格）沿用原 guid 唯一索引在 utf8mb4_unicode_ci 排序规则下的去重语义：
+# 只差大小写或末尾空格的GUID视为同一条目
+GUID_HASH_SQL = "CAST(CONV(SUBSTRING(SHA2(LOWER(RTRIM(guid)), 256), 1, 16), 16, 10) AS UNSIGNED)"
+
+
+def _normalize_guid(guid: str) -> str:
+    """与 GUID_HASH_SQL 中的 LOWER(RTRIM(guid)) 一致的规范化"""
+    return guid.rstrip(' ').lower()
+
+
+def _guid_hash(guid: str) -> int:
+    """在Python端计算与 GUID_HASH_SQL 相同的guid哈希值"""
+    return int.from_bytes(hashlib.sha256(_normalize_guid(guid).encode('utf-8')).digest()[:8], 'big')
+
+
+def _share_strings(rows, fields: Tuple[str, ...]):
+    """
+    让各行中取值相同的字符串字段共享同一个对象（原地修改）
+    
+    驱动为每行解码出独立的 str，结果集常驻内存时重复值（产品名、来源、表名等）会被保存多份。
+    """
+    cache = {}
+    share = cache.setdefault
+    for row in rows:
+        for field in fields:
+            value = row.get(field)
+            if isinstance(value, str):
+                row[field] = share(value, value)
+    return rows
+
+
+def _time_cutoff(days: Optional[float] = None, hours: Optional[float] = None) -> datetime:
+    """
+    计算 N 天/小时之前的绝对时间点，作为绑定参数传入查询
+    
+    与 cleanup_old_data/get_stats 一样使用本地时间；相比 DATE_SUB(NOW(), ...)，
+    阈值对优化器是常量，相同参数生成相同的查询。
+    """
+    return datetime.now() - timedelta(days=days or 0, hours=hours or 0)
+
+
+def _json_dumps(value: Any) -> str:
+    """序列化为JSON字符串，安装了 orjson 时使用其C实现"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+def _json_or_none(value: Any) -> Optional[str]:
+    """空值（None、空字典、空列表）存为NULL，否则序列化为JSON"""
+    return _json_dumps(value) if value else None
+
+
+# 所有基础表的建表SQL（只读，模块加载时构建一次）
+_TABLE_SCHEMAS = MappingProxyType({
+    'rss_betalist': """
+        CREATE TABLE IF NOT EXISTS rss_betalist (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            title VARCHAR(255) NOT NULL,
+            link VARCHAR(512) NOT NULL,
+            visit_url VARCHAR(512),
+            guid VARCHAR(255) NOT NULL,
+            guid_hash BIGINT UNSIGNED AS (CAST(CONV(SUBSTRING(SHA2(LOWER(RTRIM(guid)), 256), 1, 16), 16, 10) AS UNSIGNED)) STORED,
+            author VARCHAR(255),
+            summary TEXT,
+            image_url VARCHAR(512),
+            published_at DATETIME,
+            updated_at DATETIME,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_published (published_at),
+            INDEX idx_created (created_at),
+            INDEX idx_link (link),
+            UNIQUE KEY uk_guid_hash (guid_hash)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """,
+    
+    'rss_ycombinator': """
+        CREATE TABLE IF NOT EXISTS rss_ycombinator (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            title VARCHAR(255) NOT NULL,
+            link VARCHAR(512) NOT NULL,
+            guid VARCHAR(512) NOT NULL,
+            guid_hash BIGINT UNSIGNED AS (CAST(CONV(SUBSTRING(SHA2(LOWER(RTRIM(guid)), 256), 1, 16), 16, 10) AS UNSIGNED)) STORED,
+            full_content MEDIUMTEXT,
+            content_fetched_at DATETIME,
+            published_at DATETIME,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME,
+            INDEX idx_published (published_at),
+            INDEX idx_created (created_at),
+            INDEX idx_link (link(255)),
+            UNIQUE KEY uk_guid_hash (guid_hash)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """,
+
+    'rss_techcrunch': """
+        CREATE TABLE IF NOT EXISTS rss_techcrunch (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            title VARCHAR(255) NOT NULL,
+            link VARCHAR(512) UNIQUE NOT NULL,
+            full_content TEXT,
+            image_url VARCHAR(512),
+            guid VARCHAR(512) NOT NULL,
+            guid_hash BIGINT UNSIGNED AS (CAST(CONV(SUBSTRING(SHA2(LOWER(RTRIM(guid)), 256), 1, 16), 16, 10) AS UNSIGNED)) STORED,
+            published_at DATETIME,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_published (published_at),
+            INDEX idx_created (created_at),
+            UNIQUE KEY uk_guid_hash (guid_hash)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """,
+
+    'rss_theverge': """
+        CREATE TABLE IF NOT EXISTS rss_theverge (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            title VARCHAR(255) NOT NULL,
+            link VARCHAR(512) UNIQUE NOT NULL,
+            author VARCHAR(255),
+            summary TEXT,
+            image_url VARCHAR(512),
+            guid VARCHAR(255) NOT NULL,
+            guid_hash BIGINT UNSIGNED AS (CAST(CONV(SUBSTRING(SHA2(LOWER(RTRIM(guid)), 256), 1, 16), 16, 10) AS UNSIGNED)) STORED,
+            category VARCHAR(255),
+            published_at DATETIME,
+            updated_at DATETIME,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_published (published_at),
+            INDEX idx_created (created_at),
+            UNIQUE KEY uk_guid_hash (guid_hash)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """,
+    
+    'rss_indiehackers': """
+        CREATE TABLE IF NOT EXISTS rss_indiehackers (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            title VARCHAR(255) NOT NULL,
+            link VARCHAR(512) NOT NULL,
+            summary TEXT,
+            author VARCHAR(255),
+            category VARCHAR(100),
+            guid VARCHAR(512) NOT NULL,
+            guid_hash BIGINT UNSIGNED AS (CAST(CONV(SUBSTRING(SHA2(LOWER(RTRIM(guid)), 256), 1, 16), 16, 10) AS UNSIGNED)) STORED,
+            image_url VARCHAR(512),
+            full_content TEXT,
+            content_fetched_at DATETIME,
+            published_at DATETIME,
+            feed_type VARCHAR(50) NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME,
+            INDEX idx_published (published_at),
+            INDEX idx_created (created_at),
+            INDEX idx_link (link),
+            INDEX idx_content_fetched (content_fetched_at),
+            INDEX idx_feed_type (feed_type),
+            UNIQUE KEY uk_guid_hash (guid_hash)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """,
+    
+    'rss_ezindie': """
+        CREATE TABLE IF NOT EXISTS rss_ezindie (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            guid VARCHAR(255) NOT NULL,
+            guid_hash BIGINT UNSIGNED AS (CAST(CONV(SUBSTRING(SHA2(LOWER(RTRIM(guid)), 256), 1, 16), 16, 10) AS UNSIGNED)) STORED,
+            title VARCHAR(255) NOT NULL,
+            link VARCHAR(255) NOT NULL,
+            author VARCHAR(100),
+            summary VARCHAR(512),
+            cover_image_url VARCHAR(512),
+            full_content_markdown TEXT,
+            published_at DATETIME,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_published (published_at),
+            INDEX idx_created (created_at),
+            UNIQUE KEY uk_guid_hash (guid_hash)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+    """,
+
+    'rss_decohack_products': """
+        CREATE TABLE IF NOT EXISTS rss_decohack_products (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            product_name VARCHAR(100) NOT NULL COMMENT '产品名称',
+            tagline VARCHAR(200) NOT NULL COMMENT '产品标语',
+            description VARCHAR(800) NOT NULL COMMENT '产品介绍',
+            product_url VARCHAR(400) COMMENT '产品官网链接',
+            ph_url VARCHAR(400) COMMENT 'Product Hunt页面链接',
+            image_url VARCHAR(400) COMMENT '产品图片URL',
+            vote_count SMALLINT UNSIGNED DEFAULT 0 COMMENT '投票数',
+            is_featured BOOLEAN DEFAULT FALSE COMMENT '是否精选',
+            keywords VARCHAR(300) COMMENT '产品关键词',
+            ph_publish_date DATE COMMENT 'PH发布日期',
+            crawl_date DATE NOT NULL COMMENT '抓取日期',
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME ON UPDATE CURRENT_TIMESTAMP,
+            UNIQUE KEY unique_product_ph_date (product_name, ph_publish_date) COMMENT '产品名称+PH发布日期唯一，实现精准去重',
+            INDEX idx_ph_publish (ph_publish_date),
+            INDEX idx_created (created_at),
+            INDEX idx_featured (is_featured),
+            INDEX idx_votes (vote_count DESC)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        COMMENT='Decohack产品热榜数据表 - 细粒度存储每个产品信息'
+    """,
+
+    'rss_weibo': """
+        CREATE TABLE IF NOT EXISTS rss_weibo (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            user_id VARCHAR(50) NOT NULL COMMENT '微博用户ID',
+            guid VARCHAR(512) NOT NULL COMMENT '微博唯一标识',
+            guid_hash BIGINT UNSIGNED AS (CAST(CONV(SUBSTRING(SHA2(LOWER(RTRIM(guid)), 256), 1, 16), 16, 10) AS UNSIGNED)) STORED COMMENT 'guid的64位哈希，用于唯一约束',
+            title VARCHAR(512) COMMENT '微博标题/摘要',
+            link VARCHAR(512) NOT NULL COMMENT '微博链接',
+            author VARCHAR(255) COMMENT '作者名称',
+            description TEXT COMMENT '微博内容',
+            category VARCHAR(512) COMMENT '分类标签',
+            published_at DATETIME COMMENT '发布时间',
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP COMMENT '入库时间',
+            updated_at DATETIME ON UPDATE CURRENT_TIMESTAMP COMMENT '更新时间',
+            INDEX idx_user_id (user_id),
+            INDEX idx_published (published_at),
+            INDEX idx_created (created_at),
+            INDEX idx_link (link(255)),
+            UNIQUE KEY uk_guid_hash (guid_hash)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        COMMENT='微博RSS数据表'
+    """,
+
+    'discovered_products': """
+        CREATE TABLE IF NOT EXISTS discovered_products (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            product_name VARCHAR(255) NOT NULL,
+            tagline VARCHAR(512),
+            description VARCHAR(2048),
+            product_url VARCHAR(512),
+            image_url VARCHAR(512),
+            categories VARCHAR(1024),
+            metrics JSON,
+            source_feed VARCHAR(100) NOT NULL,
+            source_published_at DATETIME,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            product_name_norm VARCHAR(255) AS (LOWER(TRIM(product_name))) STORED COMMENT '规范化产品名称，用于去重',
+            INDEX idx_source_feed (source_feed),
+            INDEX idx_created_at (created_at),
+            INDEX idx_source_published_at (source_published_at),
+            INDEX idx_product_name (product_name),
+            INDEX idx_name_norm_created (product_name_norm, created_at),
+            INDEX idx_product_url (product_url),
+            UNIQUE KEY unique_product_source_date (product_name, source_feed, DATE(source_published_at))
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        COMMENT='统一产品库表 - 事件日志型表，记录每一次产品发现事件，同一产品在同一来源同一天只记录一次'
+    """,
+
+    'articles': """
+        CREATE TABLE IF NOT EXISTS articles (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            feed_id INT DEFAULT NULL,
+            title VARCHAR(512) NOT NULL,
+            url VARCHAR(1024) NOT NULL,
+            content TEXT,
+            summary TEXT,
+            published_at DATETIME,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            INDEX idx_feed_id (feed_id),
+            INDEX idx_published_at (published_at),
+            INDEX idx_created_at (created_at),
+            UNIQUE KEY unique_url (url(191))
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        COMMENT='文章表 - 存储从各种来源获取的文章信息'
+    """,
+
+    'analysis_results': """
+        CREATE TABLE IF NOT EXISTS analysis_results (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            rss_id INT NOT NULL,
+            analysis_date DATE NOT NULL,
+            result JSON NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME ON UPDATE CURRENT_TIMESTAMP,
+            FOREIGN KEY (rss_id) REFERENCES rss_betalist(id) ON DELETE CASCADE
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        COMMENT='文章分析结果表 - 存储对每篇文章的分析结果'
+    """
+})
+
+# 后续版本为所有 rss_ 表新增的字段：(字段名, 字段定义)
+_RSS_EXTRA_COLUMNS = (
+    ('processing_status', "VARCHAR(20) NOT NULL DEFAULT 'pending'"),
+    ('analysis_result', "JSON COMMENT '存储文章分析结果'"),
+)
+
+# 需要深度分析字段的表及其字段
+_DEEP_ANALYSIS_TABLES = frozenset({'rss_indiehackers', 'rss_ezindie'})
+_DEEP_ANALYSIS_COLUMNS = (
+    ('deep_analysis_data', "TEXT COMMENT '深度分析结果数据'"),
+    ('deep_analysis_status', "SMALLINT DEFAULT 0 COMMENT '0=待处理, 1=处理成功, -1=处理失败'"),
+)
+
+# 深度分析时各表的正文字段（未列出的表使用 full_content）
+_DEEP_ANALYSIS_CONTENT_FIELDS = MappingProxyType({'rss_ezindie': 'full_content_markdown'})
+
+# 产品列表查询返回的列（报告生成实际用到的字段，不含 description/metrics 等大字段）
+_PRODUCT_LIST_COLUMNS = ('id', 'product_name', 'tagline', 'product_url', 'categories',
+                         'source_feed', 'source_published_at', 'created_at')
+
+# 产品列表中取值高度重复、需要在结果集内共享字符串对象的列
+_PRODUCT_SHARED_COLUMNS = ('product_name', 'categories', 'source_feed')
+
+# 文章列表查询返回的列；正文 content 只在显式需要时读取
+_ARTICLE_LIST_COLUMNS = ('id', 'feed_id', 'title', 'url', 'summary', 'published_at', 'created_at')
+
+# 与唯一键完全重复的旧二级索引，升级时删除以减少每次写入需维护的B树
+_REDUNDANT_INDEXES = (
+    ('articles', 'idx_url'),  # 与 unique_url 的键完全相同
+)
+
+# 报告存储表的建表SQL
+_REPORT_TABLE_SCHEMAS = MappingProxyType({
+    # 产品发现报告表
+    'product_reports': """
+        CREATE TABLE IF NOT EXISTS product_reports (
+            report_id INT AUTO_INCREMENT PRIMARY KEY,
+            report_uuid VARCHAR(36) NOT NULL UNIQUE,
+            generated_at DATETIME NOT NULL,
+            report_date DATE NOT NULL,
+            time_range VARCHAR(50),
+            product_count INT,
+            source_feed_count INT,
+            report_content_md LONGTEXT,
+            metadata JSON,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    """,
+    # 科技新闻报告表
+    'technews_reports': """
+        CREATE TABLE IF NOT EXISTS technews_reports (
+            report_id INT AUTO_INCREMENT PRIMARY KEY,
+            report_uuid VARCHAR(36) NOT NULL UNIQUE,
+            generated_at DATETIME NOT NULL,
+            report_date DATE NOT NULL,
+            time_range VARCHAR(50),
+            article_count INT,
+            main_topics JSON,
+            report_content_md TEXT,
+            metadata JSON,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    """,
+    # 深度洞察报告表
+    'insights_reports': """
+        CREATE TABLE IF NOT EXISTS insights_reports (
+            report_id INT AUTO_INCREMENT PRIMARY KEY,
+            report_uuid VARCHAR(36) NOT NULL UNIQUE,
+            generated_at DATETIME NOT NULL,
+            report_date DATE NOT NULL,
+            report_title VARCHAR(255),
+            related_report_uuids JSON,
+            report_content_md TEXT,
+            metadata JSON,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    """,
+    # 综合洞察报告表
+    'synthesis_reports': """
+        CREATE TABLE IF NOT EXISTS synthesis_reports (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            report_type VARCHAR(255) NOT NULL,
+            start_date DATE,
+            end_date DATE,
+            content TEXT,
+            source_article_ids JSON,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    """
+})
+
+# 记录已应用的表结构版本，表结构未变化时启动可跳过整个检查流程
+_SCHEMA_META_DDL = """
+    CREATE TABLE IF NOT EXISTS _schema_meta (
+        meta_key VARCHAR(64) PRIMARY KEY,
+        meta_value VARCHAR(255) NOT NULL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+# 合并后的批量建表语句（基础表 + 报告表），供 init_database 一次性执行
+_TABLE_SCHEMAS_DDL = ";\n".join(
+    schema.strip().rstrip(';')
+    for schema in (*_TABLE_SCHEMAS.values(), *_REPORT_TABLE_SCHEMAS.values(), _SCHEMA_META_DDL)
+) + ";"
+
+# 当前代码期望的表结构指纹：建表SQL、补充字段或冗余索引清单变化时随之变化，触发一次完整检查
+_SCHEMA_HASH = hashlib.md5(json.dumps(
+    [dict(_TABLE_SCHEMAS), dict(_REPORT_TABLE_SCHEMAS), _RSS_EXTRA_COLUMNS,
+     sorted(_DEEP_ANALYSIS_TABLES), _DEEP_ANALYSIS_COLUMNS, _REDUNDANT_INDEXES],
+    sort_keys=True
+).encode('utf-8')).hexdigest()
+
+class GuidBloomFilter:
+    """
+    GUID布隆过滤器
+    
+    "不存在"的判断是精确的，"存在"的判断有约 error_rate 的误报率；
+    命中的GUID如需确认，应再通过 get_new_guids 精确查询。
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, guid: str):
+        # 双重哈希：由一次 blake2b 摘要派生出 num_hashes 个位置
+        # 与数据库的guid去重一致：只差大小写或末尾空格的GUID视为同一个
+        digest = hashlib.blake2b(_normalize_guid(guid).encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+    
+    def add(self, guid: str):
+        for pos in self._positions(guid):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, guid: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(guid))
+
+
 class DatabaseManager:
     """数据库管理类"""
     
+    # product_reports.report_content_md 是否已确认为 LONGTEXT（进程内共享）
+    _longtext_migrated = False
+    
+    # 插入SQL缓存（进程内共享）：(表名, 列集合, 是否IGNORE) -> (SQL, 取值函数)
+    _insert_sql_cache: Dict[Tuple[str, FrozenSet[str], bool], Tuple[str, Callable[[Dict[str, Any]], tuple]]] = {}
+    
     def __init__(self, config):
         """初始化数据库连接"""
         print("Initializing DatabaseManager...")
         self.db_config = config.get_database_config()
         self.config = config
+        self.db_name = self.db_config['database']
+        # 统计结果缓存：(表名, 是否精确) -> (时间段编号, 统计结果)
+        self._stats_cache: Dict[Tuple[str, bool], Tuple[int, Dict[str, Any]]] = {}
+        # 列表查询结果缓存：(表名, 查询参数...) -> (过期时间, 结果行)
+        self._query_cache: Dict[tuple, Tuple[float, List[Dict[str, Any]]]] = {}
+        self.query_cache_seconds = self.db_config.pop('query_cache_seconds', 0)
+        self._adapt_config_for_driver()
+        # 允许一次 execute 发送多条语句（用于批量DDL）
+        self.db_config['client_flag'] = self.db_config.get('client_flag', 0) | CLIENT.MULTI_STATEMENTS
         
         # 根据配置决定是否跳过数据库表检查
         skip_check = self.db_config.pop('skip_table_check', False)
@@ -28,12 +525,41 @@ class DatabaseManager:
         else:
             self.init_database()
     
+    def _adapt_config_for_driver(self):
+        """根据当前使用的数据库驱动调整连接参数"""
+        compress = self.db_config.pop('compress', False)
+        if db_driver.__name__ == 'MySQLdb':
+            # mysqlclient 通过 ssl_mode 指定SSL模式，并原生支持协议压缩
+            ssl_config = self.db_config.get('ssl')
+            if ssl_config and 'mode' in ssl_config:
+                self.db_config['ssl_mode'] = ssl_config['mode']
+                self.db_config.pop('ssl')
+            if compress:
+                self.db_config['compress'] = True
+        elif compress:
+            # PyMySQL 未实现协议压缩，传入 compress 会直接报错，因此这里只记录并忽略该配置
+            logger.warning("当前数据库驱动 PyMySQL 不支持协议压缩，已忽略 DB_COMPRESS 配置")
+        logger.debug(f"使用数据库驱动: {db_driver.__name__}")
+    
+    def _get_pool(self):
+        """获取（必要时创建）连接池；未安装 DBUtils 时返回 None，退回为每次新建连接"""
+        global _pool
+        if _pool is None and PooledDB is not None:
+            with _pool_lock:
+                if _pool is None:
+                    _pool = PooledDB(creator=db_driver, mincached=2, maxcached=10,
+                                     maxconnections=20, blocking=True, **self.db_config)
+                    logger.debug("数据库连接池已创建")
+        return _pool
+    
     @contextmanager
     def get_connection(self):
         """获取数据库连接的上下文管理器"""
         conn = None
         try:
-            conn = pymysql.connect(**self.db_config)
+            pool = self._get_pool()
+            # 连接池中的连接 close() 时归还到池中，而不是断开
+            conn = pool.connection() if pool else db_driver.connect(**self.db_config)
             yield conn
         except Exception as e:
             if conn:
@@ -43,276 +569,249 @@ class DatabaseManager:
             if conn:
                 conn.close()
     
+    @contextmanager
+    def session(self):
+        """
+        在同一个连接上执行多条语句的上下文管理器，正常退出时只提交一次
+        
+        用法：
+            with db_manager.session() as cursor:
+                cursor.execute(...)
+                cursor.execute(...)
+        """
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                yield cursor
+            conn.commit()
+    
     def init_database(self):
         """初始化数据库表"""
-        table_schemas = self.get_table_schemas()
+        if self._is_schema_current():
+            logger.debug("表结构版本未变化，跳过数据库表结构检查")
+            return
         
         with self.get_connection() as conn:
             with conn.cursor() as cursor:
                 # 先创建新表
-                for table_name, schema in table_schemas.items():
-                    try:
-                        # 先检查表是否存在
-                        cursor.execute(f"""
-                            SELECT COUNT(*)
-                            FROM information_schema.tables
-                            WHERE table_schema = %s AND table_name = %s
-                        """, (self.db_config['database'], table_name))
-                        
-                        if cursor.fetchone()[0] == 0:
-                            cursor.execute(schema)
-                            conn.commit()
-                            logger.info(f"表 {table_name} 创建成功")
-                        else:
-                            logger.debug(f"表 {table_name} 已存在")
-                    except Exception as e:
-                        logger.error(f"初始化表 {table_name} 失败: {e}")
-                        conn.rollback()
-                        raise
+                try:
+                    # 所有建表语句都是 CREATE TABLE IF NOT EXISTS，合并为一次多语句执行，只需一次往返
+                    cursor.execute(_TABLE_SCHEMAS_DDL)
+                    # 逐个读取剩余语句的结果，后续语句的错误会在这里抛出
+                    while cursor.nextset():
+                        pass
+                    conn.commit()
+                    logger.debug(f"已批量检查/创建 {len(_TABLE_SCHEMAS) + len(_REPORT_TABLE_SCHEMAS)} 张表")
+                except Exception as e:
+                    logger.error(f"批量初始化表失败: {e}")
+                    conn.rollback()
+                    raise
+                
+                # 一次性读取字段和索引清单，后续的结构检查都在Python端完成
+                existing_cols, existing_indexes = self._fetch_schema_inventory(cursor)
                 
                 # 然后更新表结构
                 try:
-                    self._update_table_schemas(cursor, conn)
+                    self._update_table_schemas(cursor, conn, existing_cols, existing_indexes)
                 except Exception as e:
                     logger.error(f"更新表结构失败: {e}")
                     conn.rollback()
                     raise
             
             # 创建报告相关表
-            self._create_tables_if_not_exists()
-
-    def _create_tables_if_not_exists(self):
-        """创建所有必要的数据库表（如果它们不存在）。"""
-        # 现有表的创建逻辑
-        table_schemas = self.get_table_schemas()
-        with self.get_connection() as conn:
-            with conn.cursor() as cursor:
-                for table_name, schema in table_schemas.items():
-                    try:
-                        # 先检查表是否存在
-                        cursor.execute(f"""
-                            SELECT COUNT(*)
-                            FROM information_schema.tables
-                            WHERE table_schema = %s AND table_name = %s
-                        """, (self.db_config['database'], table_name))
-                        
-                        if cursor.fetchone()[0] == 0:
-                            cursor.execute(schema)
-                            conn.commit()
-                            logger.info(f"表 {table_name} 创建成功")
-                        else:
-                            logger.debug(f"表 {table_name} 已存在")
-                    except Exception as e:
-                        logger.error(f"创建表 {table_name} 失败: {e}")
-                        conn.rollback()
-                        raise
+            migrations_ok = self._create_tables_if_not_exists(existing_cols)
+        
+        # 只有所有迁移步骤都成功时才记录版本，否则下次启动会重新检查并重试失败的步骤
+        if not migrations_ok:
+            logger.warning("部分表结构迁移失败，本次不记录表结构版本")
+            return
+        
+        # 记录本次已应用的表结构版本
+        self.execute_query(
+            "REPLACE INTO _schema_meta (meta_key, meta_value) VALUES ('schema_hash', %s)",
+            (_SCHEMA_HASH,)
+        )
+    
+    def _is_schema_current(self) -> bool:
+        """检查数据库中记录的表结构版本是否与当前代码一致"""
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT meta_value FROM _schema_meta WHERE meta_key = 'schema_hash'")
+                    row = cursor.fetchone()
+                    return bool(row) and row[0] == _SCHEMA_HASH
+        except db_driver.ProgrammingError:
+            # _schema_meta 表尚不存在（首次启动或旧版本数据库）
+            return False
+    
+    def _fetch_schema_inventory(self, cursor):
+        """
+        读取当前数据库的字段和索引清单
+        
+        表是否存在无需查询：建表语句都是 CREATE TABLE IF NOT EXISTS，已无条件执行。
+        
+        Returns:
+            (表名 -> {字段名: 数据类型}, 表名 -> 索引名集合)
+        """
+        existing_cols = defaultdict(dict)
+        cursor.execute(_COLUMN_INVENTORY_SQL, (self.db_name,))
+        for table_name, column_name, data_type in cursor.fetchall():
+            existing_cols[table_name][column_name] = data_type
+        
+        existing_indexes = defaultdict(set)
+        cursor.execute(_INDEX_INVENTORY_SQL, (self.db_name,))
+        for table_name, index_name in cursor.fetchall():
+            existing_indexes[table_name].add(index_name)
+        
+        return existing_cols, existing_indexes
 
-        # 新增：创建报告存储表
-        self._create_product_reports_table()
-        self._create_technews_reports_table()
-        self._create_insights_reports_table()
-        self._create_synthesis_reports_table()
+    def _create_tables_if_not_exists(self, existing_cols) -> bool:
+        """创建所有必要的数据库表（如果它们不存在），返回迁移步骤是否全部成功"""
+        # 基础表和报告表都已在 init_database 中批量创建，这里只需升级旧报告表的字段类型
+        ok = self._update_report_content_field(existing_cols, 'product_reports')
 
         logger.info("所有数据库表检查/创建完毕。")
+        return ok
 
-    def _create_product_reports_table(self):
-        """创建产品发现报告表"""
-        self.execute_query("""
-            CREATE TABLE IF NOT EXISTS product_reports (
-                report_id INT AUTO_INCREMENT PRIMARY KEY,
-                report_uuid VARCHAR(36) NOT NULL UNIQUE,
-                generated_at DATETIME NOT NULL,
-                report_date DATE NOT NULL,
-                time_range VARCHAR(50),
-                product_count INT,
-                source_feed_count INT,
-                report_content_md LONGTEXT,
-                metadata JSON,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-        """)
-        # 检查并更新现有表的字段类型
-        self._update_report_content_field('product_reports')
-        logger.debug("`product_reports` 表已检查/创建。")
-
-    def _create_technews_reports_table(self):
-        """创建科技新闻报告表"""
-        self.execute_query("""
-            CREATE TABLE IF NOT EXISTS technews_reports (
-                report_id INT AUTO_INCREMENT PRIMARY KEY,
-                report_uuid VARCHAR(36) NOT NULL UNIQUE,
-                generated_at DATETIME NOT NULL,
-                report_date DATE NOT NULL,
-                time_range VARCHAR(50),
-                article_count INT,
-                main_topics JSON,
-                report_content_md TEXT,
-                metadata JSON,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-        """)
-        logger.debug("`technews_reports` 表已检查/创建。")
-
-    def _create_insights_reports_table(self):
-        """创建深度洞察报告表"""
-        self.execute_query("""
-            CREATE TABLE IF NOT EXISTS insights_reports (
-                report_id INT AUTO_INCREMENT PRIMARY KEY,
-                report_uuid VARCHAR(36) NOT NULL UNIQUE,
-                generated_at DATETIME NOT NULL,
-                report_date DATE NOT NULL,
-                report_title VARCHAR(255),
-                related_report_uuids JSON,
-                report_content_md TEXT,
-                metadata JSON,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-        """)
-        logger.debug("`insights_reports` 表已检查/创建。")
-
-    def _create_synthesis_reports_table(self):
-        """创建综合洞察报告表"""
-        self.execute_query("""
-            CREATE TABLE IF NOT EXISTS synthesis_reports (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                report_type VARCHAR(255) NOT NULL,
-                start_date DATE,
-                end_date DATE,
-                content TEXT,
-                source_article_ids JSON,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-        """)
-        logger.debug("`synthesis_reports` 表已检查/创建。")
-
-    def _update_report_content_field(self, table_name: str, field_name: str = 'report_content_md'):
-        """更新报告表的内容字段类型为LONGTEXT（仅适用于product_reports表）"""
-        # 只对product_reports表进行字段类型更新
-        if table_name != 'product_reports':
-            return
-            
+    def _update_report_content_field(self, existing_cols, table_name: str, field_name: str = 'report_content_md') -> bool:
+        """更新报告表的内容字段类型为LONGTEXT（仅适用于product_reports表），失败时返回 False"""
+        # 只对product_reports表进行字段类型更新；本进程内已确认过则不再检查
+        if table_name != 'product_reports' or DatabaseManager._longtext_migrated:
+            return True
+        
+        # 字段当前类型取自启动时读取的字段清单
+        data_type = existing_cols[table_name].get(field_name)
+        if data_type is None:
+            return True
+        if data_type.upper() == 'LONGTEXT':
+            DatabaseManager._longtext_migrated = True
+            logger.debug(f"{table_name}.{field_name} 字段已经是 LONGTEXT 类型")
+            return True
+        
         try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    # 检查字段当前类型
-                    cursor.execute(f"""
-                        SELECT DATA_TYPE, CHARACTER_MAXIMUM_LENGTH
-                        FROM information_schema.COLUMNS
-                        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_NAME = %s
-                    """, (self.db_config['database'], table_name, field_name))
-                    
-                    result = cursor.fetchone()
-                    if result:
-                        data_type, max_length = result
-                        # 如果不是LONGTEXT，则更新
-                        if data_type.upper() != 'LONGTEXT':
-                            cursor.execute(f"""
-                                ALTER TABLE {table_name} 
-                                MODIFY COLUMN {field_name} LONGTEXT
-                            """)
-                            conn.commit()
-                            logger.info(f"已将 {table_name}.{field_name} 字段类型更新为 LONGTEXT")
-                        else:
-                            logger.debug(f"{table_name}.{field_name} 字段已经是 LONGTEXT 类型")
+            self.execute_query(f"""
+                ALTER TABLE {table_name} 
+                MODIFY COLUMN {field_name} LONGTEXT
+            """)
+            DatabaseManager._longtext_migrated = True
+            logger.info(f"已将 {table_name}.{field_name} 字段类型更新为 LONGTEXT")
+            return True
         except Exception as e:
             logger.error(f"更新 {table_name}.{field_name} 字段类型失败: {e}")
+            return False
 
-    def _update_table_schemas(self, cursor, conn):
+    def _update_table_schemas(self, cursor, conn, existing_cols, existing_indexes):
         """更新表结构，添加新字段"""
         # 为所有RSS表添加processing_status字段（如果不存在）
-        rss_tables = [table_name for table_name in self.get_table_schemas().keys() 
+        rss_tables = [table_name for table_name in _TABLE_SCHEMAS
                       if table_name.startswith('rss_')]
         
         for table_name in rss_tables:
             try:
-                # 检查processing_status字段是否存在
-                cursor.execute(f"""
-                    SELECT COUNT(*)
-                    FROM information_schema.columns
-                    WHERE table_schema = %s AND table_name = %s AND column_name = 'processing_status'
-                """, (self.db_config['database'], table_name))
+                columns = existing_cols[table_name]
                 
-                if cursor.fetchone()[0] == 0:
-                    # 字段不存在，添加它
-                    cursor.execute(f"""
-                        ALTER TABLE {table_name} 
-                        ADD COLUMN processing_status VARCHAR(20) NOT NULL DEFAULT 'pending'
-                    """)
-                    conn.commit()
-                    logger.info(f"为表 {table_name} 添加 processing_status 字段成功")
-                else:
-                    logger.debug(f"表 {table_name} 已存在 processing_status 字段")
+                # 所有缺失字段合并为一条 ALTER TABLE，只触发一次表结构变更
+                column_specs = list(_RSS_EXTRA_COLUMNS)
+                # 为 indiehackers 和 ezindie 表添加深度分析字段
+                if table_name in _DEEP_ANALYSIS_TABLES:
+                    column_specs.extend(_DEEP_ANALYSIS_COLUMNS)
+                self._add_missing_columns(cursor, conn, table_name, columns, column_specs)
                     
-                # 检查analysis_result字段是否存在（用于存储分析结果）
-                cursor.execute(f"""
-                    SELECT COUNT(*)
-                    FROM information_schema.columns
-                    WHERE table_schema = %s AND table_name = %s AND column_name = 'analysis_result'
-                """, (self.db_config['database'], table_name))
-                
-                if cursor.fetchone()[0] == 0:
-                    # 字段不存在，添加它
-                    cursor.execute(f"""
-                        ALTER TABLE {table_name} 
-                        ADD COLUMN analysis_result JSON COMMENT '存储文章分析结果'
-                    """)
-                    conn.commit()
-                    logger.info(f"为表 {table_name} 添加 analysis_result 字段成功")
-                else:
-                    logger.debug(f"表 {table_name} 已存在 analysis_result 字段")
+                # 为按created_at清理/统计的查询补充索引
+                self._ensure_created_index(cursor, conn, table_name, existing_indexes[table_name])
                     
-                # 为 indiehackers 和 ezindie 表添加深度分析字段
-                if table_name in ['rss_indiehackers', 'rss_ezindie']:
-                    self._add_deep_analysis_fields(cursor, conn, table_name)
+                # 将guid唯一约束迁移到8字节的guid_hash上
+                if 'guid_hash' in _TABLE_SCHEMAS[table_name]:
+                    self._migrate_guid_hash(cursor, conn, table_name, columns)
                     
             except Exception as e:
                 logger.error(f"为表 {table_name} 添加字段失败: {e}")
                 raise
+        
+        for table_name, index_name in _REDUNDANT_INDEXES:
+            self._drop_redundant_index(cursor, conn, table_name, index_name, existing_indexes[table_name])
+        
+        self._migrate_product_name_norm(cursor, conn, existing_cols['discovered_products'])
 
-    def _add_deep_analysis_fields(self, cursor, conn, table_name):
-        """为指定表添加深度分析相关字段"""
-        try:
-            # 检查 deep_analysis_data 字段是否存在
-            cursor.execute(f"""
-                SELECT COUNT(*)
-                FROM information_schema.columns
-                WHERE table_schema = %s AND table_name = %s AND column_name = 'deep_analysis_data'
-            """, (self.db_config['database'], table_name))
-            
-            if cursor.fetchone()[0] == 0:
-                cursor.execute(f"""
-                    ALTER TABLE {table_name} 
-                    ADD COLUMN deep_analysis_data TEXT COMMENT '深度分析结果数据'
-                """)
-                conn.commit()
-                logger.info(f"为表 {table_name} 添加 deep_analysis_data 字段成功")
-            else:
-                logger.debug(f"表 {table_name} 已存在 deep_analysis_data 字段")
-            
-            # 检查 deep_analysis_status 字段是否存在
+    def _migrate_product_name_norm(self, cursor, conn, columns):
+        """为旧的 discovered_products 表添加规范化产品名称生成列及去重索引"""
+        if 'product_name_norm' not in columns:
+            cursor.execute("""
+                ALTER TABLE discovered_products
+                ADD COLUMN product_name_norm VARCHAR(255) AS (LOWER(TRIM(product_name))) STORED COMMENT '规范化产品名称，用于去重',
+                ADD INDEX idx_name_norm_created (product_name_norm, created_at)
+            """)
+            conn.commit()
+            logger.info("为表 discovered_products 添加 product_name_norm 字段及索引成功")
+
+    def _drop_redundant_index(self, cursor, conn, table_name, index_name, indexes):
+        """删除与唯一键重复的旧二级索引"""
+        if index_name in indexes:
+            cursor.execute(f"ALTER TABLE {table_name} DROP INDEX {index_name}")
+            conn.commit()
+            logger.info(f"删除表 {table_name} 的冗余索引 {index_name} 成功")
+
+    def _ensure_created_index(self, cursor, conn, table_name, indexes):
+        """为旧表补充 created_at 索引，使按保留期清理成为索引范围扫描"""
+        if 'idx_created' not in indexes:
+            cursor.execute(f"ALTER TABLE {table_name} ADD INDEX idx_created (created_at)")
+            conn.commit()
+            logger.info(f"为表 {table_name} 添加 idx_created 索引成功")
+        else:
+            logger.debug(f"表 {table_name} 已存在 idx_created 索引")
+
+    def _migrate_guid_hash(self, cursor, conn, table_name, columns):
+        """为旧表添加guid_hash生成列，并用它替换原有的guid唯一索引；已有的未规范化guid_hash列改为新表达式"""
+        if 'guid_hash' not in columns:
+            # 原唯一索引名由MySQL自动生成（通常为 guid），按字段查找而不是假定名称
+            cursor.execute("""
+                SELECT DISTINCT index_name FROM information_schema.statistics
+                WHERE table_schema = %s AND table_name = %s AND column_name = 'guid' AND non_unique = 0
+            """, (self.db_name, table_name))
+            drop_clauses = ''.join(f",\n                DROP INDEX `{row[0]}`" for row in cursor.fetchall())
             cursor.execute(f"""
-                SELECT COUNT(*)
-                FROM information_schema.columns
-                WHERE table_schema = %s AND table_name = %s AND column_name = 'deep_analysis_status'
-            """, (self.db_config['database'], table_name))
-            
-            if cursor.fetchone()[0] == 0:
-                cursor.execute(f"""
-                    ALTER TABLE {table_name} 
-                    ADD COLUMN deep_analysis_status SMALLINT DEFAULT 0 COMMENT '0=待处理, 1=处理成功, -1=处理失败'
-                """)
-                conn.commit()
-                logger.info(f"为表 {table_name} 添加 deep_analysis_status 字段成功")
-            else:
-                logger.debug(f"表 {table_name} 已存在 deep_analysis_status 字段")
-                
-        except Exception as e:
-            logger.error(f"为表 {table_name} 添加深度分析字段失败: {e}")
-            raise
+                ALTER TABLE {table_name}
+                ADD COLUMN guid_hash BIGINT UNSIGNED AS ({GUID_HASH_SQL}) STORED,
+                ADD UNIQUE KEY uk_guid_hash (guid_hash){drop_clauses}
+            """)
+            conn.commit()
+            logger.info(f"为表 {table_name} 添加 guid_hash 唯一索引成功")
+            return
+        
+        # 早期的guid_hash直接对原始guid取哈希（区分大小写），改为规范化后的表达式
+        cursor.execute("""
+            SELECT generation_expression FROM information_schema.columns
+            WHERE table_schema = %s AND table_name = %s AND column_name = 'guid_hash'
+        """, (self.db_name, table_name))
+        row = cursor.fetchone()
+        if row and 'lower' not in (row[0] or '').lower():
+            try:
+                # 沿用建表语句中的字段定义（含注释），避免 MODIFY 丢失注释
+                definition = next(line.strip().rstrip(',') for line in _TABLE_SCHEMAS[table_name].splitlines()
+                                  if line.strip().startswith('guid_hash '))
+                cursor.execute(f"ALTER TABLE {table_name} MODIFY COLUMN {definition}")
+            except db_driver.IntegrityError:
+                logger.error(f"表 {table_name} 中存在只差大小写或末尾空格的重复GUID，需先清理后才能更新 guid_hash")
+                raise
+            conn.commit()
+            logger.info(f"表 {table_name} 的 guid_hash 已改为规范化guid的哈希")
+        else:
+            logger.debug(f"表 {table_name} 已存在 guid_hash 字段")
+
+    def _add_missing_columns(self, cursor, conn, table_name, columns, column_specs):
+        """用一条 ALTER TABLE 为指定表补齐所有缺失字段"""
+        missing = [(name, spec) for name, spec in column_specs if name not in columns]
+        if not missing:
+            logger.debug(f"表 {table_name} 字段已完整")
+            return
+        
+        add_clauses = ',\n'.join(f"ADD COLUMN {name} {spec}" for name, spec in missing)
+        cursor.execute(f"ALTER TABLE {table_name}\n{add_clauses}")
+        conn.commit()
+        logger.info(f"为表 {table_name} 添加字段成功: {', '.join(name for name, _ in missing)}")
 
     def drop_all_rss_tables(self):
         """删除所有RSS相关的表"""
-        table_names = self.get_table_schemas().keys()
+        table_names = _TABLE_SCHEMAS.keys()
         with self.get_connection() as conn:
             with conn.cursor() as cursor:
                 for table_name in table_names:
@@ -322,336 +821,452 @@ class DatabaseManager:
                         logger.info(f"表 {table_name} 删除成功")
                     except Exception as e:
                         logger.error(f"删除表 {table_name} 失败: {e}")
+                
+                # 清除已记录的表结构版本，否则随后的 init_database 会认为表结构已是最新而跳过建表
+                try:
+                    cursor.execute("DELETE FROM _schema_meta WHERE meta_key = 'schema_hash'")
+                    conn.commit()
+                except db_driver.ProgrammingError:
+                    # _schema_meta 表不存在，无需清除
+                    pass
 
-    def get_table_schemas(self) -> Dict[str, str]:
+    def get_table_schemas(self) -> Mapping[str, str]:
         """获取所有表的创建SQL"""
-        return {
-            'rss_betalist': """
-                CREATE TABLE IF NOT EXISTS rss_betalist (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    title VARCHAR(255) NOT NULL,
-                    link VARCHAR(512) NOT NULL,
-                    visit_url VARCHAR(512),
-                    guid VARCHAR(255) UNIQUE NOT NULL,
-                    author VARCHAR(255),
-                    summary TEXT,
-                    image_url VARCHAR(512),
-                    published_at DATETIME,
-                    updated_at DATETIME,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    INDEX idx_published (published_at),
-                    INDEX idx_link (link)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """,
-            
-            'rss_ycombinator': """
-                CREATE TABLE IF NOT EXISTS rss_ycombinator (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    title VARCHAR(255) NOT NULL,
-                    link VARCHAR(512) NOT NULL,
-                    guid VARCHAR(512) UNIQUE NOT NULL,
-                    full_content MEDIUMTEXT,
-                    content_fetched_at DATETIME,
-                    published_at DATETIME,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME,
-                    INDEX idx_published (published_at),
-                    INDEX idx_link (link(255))
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """,
-
-            'rss_techcrunch': """
-                CREATE TABLE IF NOT EXISTS rss_techcrunch (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    title VARCHAR(255) NOT NULL,
-                    link VARCHAR(512) UNIQUE NOT NULL,
-                    full_content TEXT,
-                    image_url VARCHAR(512),
-                    guid VARCHAR(512) UNIQUE NOT NULL,
-                    published_at DATETIME,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    INDEX idx_published (published_at)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """,
-
-            'rss_theverge': """
-                CREATE TABLE IF NOT EXISTS rss_theverge (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    title VARCHAR(255) NOT NULL,
-                    link VARCHAR(512) UNIQUE NOT NULL,
-                    author VARCHAR(255),
-                    summary TEXT,
-                    image_url VARCHAR(512),
-                    guid VARCHAR(255) UNIQUE NOT NULL,
-                    category VARCHAR(255),
-                    published_at DATETIME,
-                    updated_at DATETIME,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    INDEX idx_published (published_at)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """,
-            
-            'rss_indiehackers': """
-                CREATE TABLE IF NOT EXISTS rss_indiehackers (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    title VARCHAR(255) NOT NULL,
-                    link VARCHAR(512) NOT NULL,
-                    summary TEXT,
-                    author VARCHAR(255),
-                    category VARCHAR(100),
-                    guid VARCHAR(512) UNIQUE NOT NULL,
-                    image_url VARCHAR(512),
-                    full_content TEXT,
-                    content_fetched_at DATETIME,
-                    published_at DATETIME,
-                    feed_type VARCHAR(50) NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME,
-                    INDEX idx_published (published_at),
-                    INDEX idx_link (link),
-                    INDEX idx_content_fetched (content_fetched_at),
-                    INDEX idx_feed_type (feed_type)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-            """,
-            
-            'rss_ezindie': """
-                CREATE TABLE IF NOT EXISTS rss_ezindie (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    guid VARCHAR(255) UNIQUE NOT NULL,
-                    title VARCHAR(255) NOT NULL,
-                    link VARCHAR(255) NOT NULL,
-                    author VARCHAR(100),
-                    summary VARCHAR(512),
-                    cover_image_url VARCHAR(512),
-                    full_content_markdown TEXT,
-                    published_at DATETIME,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    INDEX idx_published (published_at)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
-            """,
-
-            'rss_decohack_products': """
-                CREATE TABLE IF NOT EXISTS rss_decohack_products (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    product_name VARCHAR(100) NOT NULL COMMENT '产品名称',
-                    tagline VARCHAR(200) NOT NULL COMMENT '产品标语',
-                    description VARCHAR(800) NOT NULL COMMENT '产品介绍',
-                    product_url VARCHAR(400) COMMENT '产品官网链接',
-                    ph_url VARCHAR(400) COMMENT 'Product Hunt页面链接',
-                    image_url VARCHAR(400) COMMENT '产品图片URL',
-                    vote_count SMALLINT UNSIGNED DEFAULT 0 COMMENT '投票数',
-                    is_featured BOOLEAN DEFAULT FALSE COMMENT '是否精选',
-                    keywords VARCHAR(300) COMMENT '产品关键词',
-                    ph_publish_date DATE COMMENT 'PH发布日期',
-                    crawl_date DATE NOT NULL COMMENT '抓取日期',
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME ON UPDATE CURRENT_TIMESTAMP,
-                    UNIQUE KEY unique_product_ph_date (product_name, ph_publish_date) COMMENT '产品名称+PH发布日期唯一，实现精准去重',
-                    INDEX idx_ph_publish (ph_publish_date),
-                    INDEX idx_featured (is_featured),
-                    INDEX idx_votes (vote_count DESC)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-                COMMENT='Decohack产品热榜数据表 - 细粒度存储每个产品信息'
-            """,
-
-            'rss_weibo': """
-                CREATE TABLE IF NOT EXISTS rss_weibo (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    user_id VARCHAR(50) NOT NULL COMMENT '微博用户ID',
-                    guid VARCHAR(512) UNIQUE NOT NULL COMMENT '微博唯一标识',
-                    title VARCHAR(512) COMMENT '微博标题/摘要',
-                    link VARCHAR(512) NOT NULL COMMENT '微博链接',
-                    author VARCHAR(255) COMMENT '作者名称',
-                    description TEXT COMMENT '微博内容',
-                    category VARCHAR(512) COMMENT '分类标签',
-                    published_at DATETIME COMMENT '发布时间',
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP COMMENT '入库时间',
-                    updated_at DATETIME ON UPDATE CURRENT_TIMESTAMP COMMENT '更新时间',
-                    INDEX idx_user_id (user_id),
-                    INDEX idx_published (published_at),
-                    INDEX idx_link (link(255))
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-                COMMENT='微博RSS数据表'
-            """,
-
-            'discovered_products': """
-                CREATE TABLE IF NOT EXISTS discovered_products (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    product_name VARCHAR(255) NOT NULL,
-                    tagline VARCHAR(512),
-                    description VARCHAR(2048),
-                    product_url VARCHAR(512),
-                    image_url VARCHAR(512),
-                    categories VARCHAR(1024),
-                    metrics JSON,
-                    source_feed VARCHAR(100) NOT NULL,
-                    source_published_at DATETIME,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    INDEX idx_source_feed (source_feed),
-                    INDEX idx_created_at (created_at),
-                    INDEX idx_source_published_at (source_published_at),
-                    INDEX idx_product_name (product_name),
-                    INDEX idx_product_url (product_url),
-                    UNIQUE KEY unique_product_source_date (product_name, source_feed, DATE(source_published_at))
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-                COMMENT='统一产品库表 - 事件日志型表，记录每一次产品发现事件，同一产品在同一来源同一天只记录一次'
-            """,
-
-            'articles': """
-                CREATE TABLE IF NOT EXISTS articles (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    feed_id INT DEFAULT NULL,
-                    title VARCHAR(512) NOT NULL,
-                    url VARCHAR(1024) NOT NULL,
-                    content TEXT,
-                    summary TEXT,
-                    published_at DATETIME,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    INDEX idx_feed_id (feed_id),
-                    INDEX idx_url (url(191)),
-                    INDEX idx_published_at (published_at),
-                    INDEX idx_created_at (created_at),
-                    UNIQUE KEY unique_url (url(191))
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-                COMMENT='文章表 - 存储从各种来源获取的文章信息'
-            """,
-
-            'analysis_results': """
-                CREATE TABLE IF NOT EXISTS analysis_results (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    rss_id INT NOT NULL,
-                    analysis_date DATE NOT NULL,
-                    result JSON NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME ON UPDATE CURRENT_TIMESTAMP,
-                    FOREIGN KEY (rss_id) REFERENCES rss_betalist(id) ON DELETE CASCADE
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-                COMMENT='文章分析结果表 - 存储对每篇文章的分析结果'
-            """
-        }
+        return _TABLE_SCHEMAS
     
     def insert_rss_item(self, table_name: str, item_data: Dict[str, Any]) -> bool:
         """插入RSS条目（单条插入，兼容旧代码）"""
         return self.insert_rss_items_batch(table_name, [item_data])
     
+    def _get_insert_statement(self, table_name: str, item: Dict[str, Any],
+                              ignore: bool = False) -> Tuple[str, Callable[[Dict[str, Any]], tuple]]:
+        """
+        获取（并缓存）指定表与列集合对应的插入SQL和取值函数
+        
+        ignore 为 True 时生成 INSERT IGNORE，否则生成 INSERT ... ON DUPLICATE KEY UPDATE。
+        """
+        key = (table_name, frozenset(item.keys()), ignore)
+        cached = self._insert_sql_cache.get(key)
+        if cached is None:
+            column_names = list(item.keys())
+            columns = ', '.join(f"`{k}`" for k in column_names)
+            placeholders = ', '.join(['%s'] * len(column_names))
+            
+            # 单行SQL，确保命中驱动的 INSERT ... VALUES 改写规则，executemany 会合并为一条多行INSERT
+            if ignore:
+                sql = f"INSERT IGNORE INTO {table_name} ({columns}) VALUES ({placeholders})"
+            else:
+                # 所有列值都相同时 MySQL 不会改写该行，也不会触发 ON UPDATE CURRENT_TIMESTAMP，
+                # 因此无需写成 IF(VALUES(col) <=> col, col, VALUES(col)) 的条件形式。
+                # 保留 VALUES(col) 而不是 8.0.19+ 的 "AS new ... new.col" 别名写法：
+                # 驱动的 executemany 改写规则要求 VALUES (...) 之后紧跟 ON DUPLICATE，别名会使其退化为逐行执行
+                update_clause = ', '.join([f"`{k}` = VALUES(`{k}`)" for k in column_names if k != 'guid'])
+                sql = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders}) ON DUPLICATE KEY UPDATE {update_clause}"
+            
+            # 按固定列顺序取值；itemgetter 只有一个列时返回标量，需要包装成元组
+            getter = itemgetter(*column_names)
+            if len(column_names) == 1:
+                single_getter = getter
+                getter = lambda row: (single_getter(row),)
+            
+            cached = (sql, getter)
+            self._insert_sql_cache[key] = cached
+        return cached
+    
     def insert_rss_items_batch(self, table_name: str, items_data: List[Dict[str, Any]]) -> int:
         """批量插入RSS条目"""
         if not items_data:
             return 0
         
-        # 构建插入SQL
-        columns = ', '.join(items_data[0].keys())
-        placeholders = ', '.join(['%s'] * len(items_data[0]))
-        update_clause = ', '.join([f"{k} = VALUES({k})" for k in items_data[0].keys() if k != 'guid'])
-        
-        sql = f"""
-            INSERT INTO {table_name} ({columns})
-            VALUES ({placeholders})
-            ON DUPLICATE KEY UPDATE {update_clause}
-        """
+        sql, row_values = self._get_insert_statement(table_name, items_data[0])
         
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cursor:
-                    # 批量插入
-                    values_list = [list(item.values()) for item in items_data]
-                    cursor.executemany(sql, values_list)
+                    # 分块批量插入，避免单个语句超过 max_allowed_packet
+                    values_list = [row_values(item) for item in items_data]
+                    inserted_count = 0
+                    for start in range(0, len(values_list), INSERT_CHUNK_SIZE):
+                        cursor.executemany(sql, values_list[start:start + INSERT_CHUNK_SIZE])
+                        inserted_count += cursor.rowcount
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"批量插入 {table_name} 执行SQL: {str(getattr(cursor, '_last_executed', None) or getattr(cursor, '_executed', ''))[:200]}")
                     conn.commit()
-                    inserted_count = cursor.rowcount
-                    logger.info(f"批量插入 {table_name}: {inserted_count} 条记录")
+                    self.invalidate_stats_cache(table_name)
+                    self.invalidate_query_cache(table_name)
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"批量插入 {table_name}: {inserted_count} 条记录")
                     return inserted_count
         except Exception as e:
             logger.error(f"批量插入数据失败: {e}")
             return 0
 
+    @staticmethod
+    def _tsv_field(value: Any) -> str:
+        """将单个值转换为 LOAD DATA 默认格式（制表符分隔、反斜杠转义）的字段"""
+        if value is None:
+            return '\\N'
+        return (str(value)
+                .replace('\\', '\\\\')
+                .replace('\t', '\\t')
+                .replace('\n', '\\n')
+                .replace('\r', '\\r')
+                .replace('\0', '\\0'))
+    
+    def bulk_load(self, table_name: str, items_data: List[Dict[str, Any]]) -> int:
+        """
+        通过 LOAD DATA LOCAL INFILE 批量导入RSS条目，用于大批量历史数据回填
+        
+        数据先导入与目标表结构相同的临时表，再用 INSERT ... SELECT ... ON DUPLICATE KEY UPDATE
+        合并到目标表，去重语义与 insert_rss_items_batch 一致。需要服务端开启 local_infile。
+        
+        Args:
+            table_name: 表名
+            items_data: 条目列表，所有条目的列集合需与第一条一致
+            
+        Returns:
+            受影响的行数
+        """
+        if not items_data:
+            return 0
+        
+        column_names = list(items_data[0].keys())
+        columns = ', '.join(column_names)
+        update_clause = ', '.join([f"{k} = VALUES({k})" for k in column_names if k != 'guid'])
+        temp_table = f"tmp_bulk_{table_name}"
+        
+        # 驱动从文件路径读取数据，因此先写入临时文件
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='', suffix='.tsv', delete=False) as f:
+            data_path = f.name
+            for item in items_data:
+                f.write('\t'.join(self._tsv_field(item.get(k)) for k in column_names))
+                f.write('\n')
+        
+        conn = None
+        try:
+            conn = db_driver.connect(**self.db_config, local_infile=True)
+            with conn.cursor() as cursor:
+                cursor.execute(f"CREATE TEMPORARY TABLE {temp_table} LIKE {table_name}")
+                cursor.execute(f"""
+                    LOAD DATA LOCAL INFILE %s INTO TABLE {temp_table}
+                    CHARACTER SET utf8mb4
+                    FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n'
+                    ({columns})
+                """, (data_path,))
+                cursor.execute(f"""
+                    INSERT INTO {table_name} ({columns})
+                    SELECT {columns} FROM {temp_table}
+                    ON DUPLICATE KEY UPDATE {update_clause}
+                """)
+                affected = cursor.rowcount
+                cursor.execute(f"DROP TEMPORARY TABLE {temp_table}")
+            conn.commit()
+            self.invalidate_stats_cache(table_name)
+            self.invalidate_query_cache(table_name)
+            logger.info(f"批量导入 {table_name}: {len(items_data)} 条记录，影响 {affected} 行")
+            return affected
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            logger.error(f"LOAD DATA 批量导入失败: {e}")
+            return 0
+        finally:
+            if conn:
+                conn.close()
+            os.remove(data_path)
+
     def batch_insert_decohack_products(self, products_data: List[Dict[str, Any]]) -> int:
         """批量插入Decohack产品，使用INSERT IGNORE去重"""
         if not products_data:
             return 0
         
-        # 确保所有字典的键顺序一致
-        columns = list(products_data[0].keys())
-        columns_sql = ', '.join(f"`{c}`" for c in columns)
-        placeholders = ', '.join(['%s'] * len(columns))
-        
-        sql = f"""
-            INSERT IGNORE INTO rss_decohack_products ({columns_sql})
-            VALUES ({placeholders})
-        """
+        # 与RSS条目共用SQL缓存，按第一条记录的列顺序取值
+        sql, row_values = self._get_insert_statement('rss_decohack_products', products_data[0], ignore=True)
         
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cursor:
                     # 将字典列表转换为元组列表
-                    values_list = [tuple(item.get(col) for col in columns) for item in products_data]
+                    values_list = [row_values(item) for item in products_data]
                     
-                    cursor.executemany(sql, values_list)
+                    # 与RSS条目相同，分块合并为多行INSERT
+                    inserted_count = 0
+                    for start in range(0, len(values_list), INSERT_CHUNK_SIZE):
+                        cursor.executemany(sql, values_list[start:start + INSERT_CHUNK_SIZE])
+                        inserted_count += cursor.rowcount
                     conn.commit()
-                    inserted_count = cursor.rowcount
-                    logger.info(f"批量插入 Decohack 产品: {inserted_count} 条新记录被插入")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"批量插入 Decohack 产品: {inserted_count} 条新记录被插入")
                     return inserted_count
         except Exception as e:
             logger.error(f"批量插入 Decohack 产品数据失败: {e}")
             return 0
     
     def get_existing_guids(self, table_name: str) -> set:
-        """获取已存在的GUID集合"""
+        """
+        获取已存在的GUID集合
+        
+        注意：该方法会读取整张表的GUID，仅建议用于调试；
+        入库前去重请使用 get_new_guids，只查询本批候选GUID。
+        """
         try:
             with self.get_connection() as conn:
-                with conn.cursor() as cursor:
+                # 使用无缓冲游标逐行读取，避免先把整个结果集缓存在内存中；
+                # 流式游标在读完之前会占用连接，因此只在这个独立连接上使用
+                with conn.cursor(db_driver.cursors.SSCursor) as cursor:
                     cursor.execute(f"SELECT guid FROM {table_name}")
-                    return {row[0] for row in cursor.fetchall()}
+                    return {row[0] for row in cursor}
         except Exception as e:
             logger.error(f"获取已存在GUID失败: {e}")
             return set()
     
+    def get_existing_guid_bloom(self, table_name: str, error_rate: float = 0.01) -> GuidBloomFilter:
+        """
+        以布隆过滤器的形式获取已存在的GUID，只需判断"是否为新条目"时使用
+        
+        每个GUID约占 10 bit（1%误报率），远小于Python集合中每个字符串约200字节的开销。
+        
+        Args:
+            table_name: 表名
+            error_rate: 允许的误报率
+            
+        Returns:
+            包含表中所有GUID的布隆过滤器；查询失败时返回空过滤器（即全部视为新条目）
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    # 用估算行数确定过滤器容量，留出一定余量
+                    cursor.execute(_TABLE_ROWS_SQL, (self.db_name, table_name))
+                    row = cursor.fetchone()
+                    estimated_rows = int(row[0] or 0) if row else 0
+                
+                bloom = GuidBloomFilter(int(estimated_rows * 1.2) + 1000, error_rate)
+                # 流式读取，边接收边写入过滤器
+                with conn.cursor(db_driver.cursors.SSCursor) as cursor:
+                    cursor.execute(f"SELECT guid FROM {table_name}")
+                    for (guid,) in cursor:
+                        bloom.add(guid)
+                return bloom
+        except Exception as e:
+            logger.error(f"构建GUID布隆过滤器失败: {e}")
+            return GuidBloomFilter(1, error_rate)
+    
+    def get_new_guids(self, table_name: str, candidate_guids: List[str]) -> set:
+        """
+        从候选GUID中筛选出数据库中尚不存在的GUID
+        
+        只按候选GUID的哈希做 guid_hash IN (...) 查询，走8字节的唯一索引，
+        开销与候选数量相关而与表大小无关。
+        
+        Args:
+            table_name: 表名
+            candidate_guids: 本批待入库条目的GUID列表
+            
+        Returns:
+            尚未入库的GUID集合
+        """
+        candidates = set(candidate_guids)
+        if not candidates:
+            return set()
+        
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    hash_by_guid = {guid: _guid_hash(guid) for guid in candidates}
+                    hashes = list(set(hash_by_guid.values()))
+                    existing = set()
+                    # 分块查询，避免候选过多时单条语句过长
+                    for start in range(0, len(hashes), GUID_FILTER_CHUNK_SIZE):
+                        chunk = hashes[start:start + GUID_FILTER_CHUNK_SIZE]
+                        placeholders = ', '.join(['%s'] * len(chunk))
+                        cursor.execute(
+                            f"SELECT guid_hash FROM {table_name} WHERE guid_hash IN ({placeholders})",
+                            tuple(chunk)
+                        )
+                        existing.update(row[0] for row in cursor.fetchall())
+                    # 按哈希比较：只差大小写或末尾空格的GUID与库中已有条目视为重复，与唯一索引一致
+                    return {guid for guid, guid_hash in hash_by_guid.items() if guid_hash not in existing}
+        except Exception as e:
+            logger.error(f"筛选新GUID失败: {e}")
+            # 查询失败时视为全部是新条目，交由 ON DUPLICATE KEY UPDATE 兜底去重
+            return candidates
+    
     def cleanup_old_data(self, table_name: str, days: int = None) -> int:
         """清理旧数据"""
         if days is None:
             days = config.get_data_retention_days()
         
-        cutoff_date = datetime.now() - timedelta(days=days)
+        cutoff_date = _time_cutoff(days=days)
         
         try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    sql = f"DELETE FROM {table_name} WHERE created_at < %s"
+            with self.session() as cursor:
+                # 分块删除，每块单独提交，缩短行锁持有时间并避免产生巨大的undo/binlog
+                # 按 created_at 排序可沿 idx_created 做范围扫描
+                sql = f"DELETE FROM {table_name} WHERE created_at < %s ORDER BY created_at LIMIT {CLEANUP_CHUNK_SIZE}"
+                deleted_count = 0
+                while True:
                     cursor.execute(sql, (cutoff_date,))
-                    deleted_count = cursor.rowcount
-                    conn.commit()
-                    return deleted_count
+                    chunk_deleted = cursor.rowcount
+                    cursor.connection.commit()
+                    deleted_count += chunk_deleted
+                    if chunk_deleted < CLEANUP_CHUNK_SIZE:
+                        break
+                    time.sleep(CLEANUP_PAUSE_SECONDS)
+                if deleted_count:
+                    self.invalidate_stats_cache(table_name)
+                    self.invalidate_query_cache(table_name)
+                return deleted_count
         except Exception as e:
             logger.error(f"清理旧数据失败: {e}")
             return 0
     
-    def get_stats(self, table_name: str) -> Dict[str, Any]:
-        """获取统计信息"""
+    def get_stats(self, table_name: str, exact: bool = False) -> Dict[str, Any]:
+        """
+        获取统计信息
+        
+        Args:
+            table_name: 表名
+            exact: 是否精确统计总记录数。默认读取 information_schema 中的估算行数，
+                   避免 InnoDB 对 COUNT(*) 做全索引扫描
+        
+        同一表在 STATS_CACHE_SECONDS 的时间段内只查询一次，写入后可调用 invalidate_stats_cache 刷新。
+        """
+        bucket = int(time.time() // STATS_CACHE_SECONDS)
+        cached = self._stats_cache.get((table_name, exact))
+        if cached and cached[0] == bucket:
+            return dict(cached[1])
+        
         try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    # 总记录数
-                    cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-                    total_count = cursor.fetchone()[0]
-                    
-                    # 今日新增
-                    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-                    cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE created_at >= %s", (today,))
-                    today_count = cursor.fetchone()[0]
-                    
-                    # 最新记录时间
-                    cursor.execute(f"SELECT MAX(created_at) FROM {table_name}")
-                    latest_time = cursor.fetchone()[0]
-                    
-                    return {
-                        'total_count': total_count,
-                        'today_count': today_count,
-                        'latest_time': latest_time
-                    }
+            with self.session() as cursor:
+                # 总记录数、今日新增、最新记录时间在一次查询中完成
+                today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+                sql, params = self._stats_select(table_name, today, exact)
+                cursor.execute(sql, params)
+                total_count, today_count, latest_time = cursor.fetchone()
+                # 空表时 SUM 返回 NULL，且其类型为 Decimal；估算行数也可能为 NULL
+                total_count = int(total_count or 0)
+                today_count = int(today_count or 0)
+                
+                stats = {
+                    'total_count': total_count,
+                    'today_count': today_count,
+                    'latest_time': latest_time
+                }
+                self._stats_cache[(table_name, exact)] = (bucket, stats)
+                return dict(stats)
         except Exception as e:
             logger.error(f"获取统计信息失败: {e}")
             return {'total_count': 0, 'today_count': 0, 'latest_time': None}
     
+    def _stats_select(self, table_name: str, today: datetime, exact: bool,
+                      with_name: bool = False) -> Tuple[str, tuple]:
+        """
+        生成单表统计查询：(总记录数, 今日新增, 最新记录时间)
+        
+        估算模式下每个值都是独立的标量子查询，不再有对整表的聚合：今日新增走 idx_created 的范围扫描，
+        MAX(created_at) 只读索引末端。只有 exact 模式才对整表做一次 COUNT(*)。
+        with_name 为 True 时在第一列附带表名（供 UNION ALL 区分各表）。
+        """
+        name_col, name_params = ("%s, ", (table_name,)) if with_name else ("", ())
+        if exact:
+            sql = f"""
+                SELECT {name_col}COUNT(*),
+                       SUM(created_at >= %s),
+                       MAX(created_at)
+                FROM {table_name}
+            """
+            return sql, name_params + (today,)
+        sql = f"""
+            SELECT {name_col}({_TABLE_ROWS_SQL}),
+                   (SELECT COUNT(*) FROM {table_name} WHERE created_at >= %s),
+                   (SELECT MAX(created_at) FROM {table_name})
+        """
+        return sql, name_params + (self.db_name, table_name, today)
+
+    def invalidate_stats_cache(self, table_name: str = None):
+        """清除统计结果缓存；不指定表名时清除全部"""
+        if table_name is None:
+            self._stats_cache.clear()
+        else:
+            self._stats_cache.pop((table_name, False), None)
+            self._stats_cache.pop((table_name, True), None)
+    
+    def _cached_rows(self, key: tuple, load: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        在 query_cache_seconds 内复用相同参数的列表查询结果
+        
+        key 的第一个元素为表名，供 invalidate_query_cache 按表失效；返回行字典的副本，
+        调用方修改结果不会污染缓存。空结果（含查询失败）不缓存，下次调用会重新查询。
+        """
+        if self.query_cache_seconds <= 0:
+            return load()
+        
+        now = time.monotonic()
+        cached = self._query_cache.get(key)
+        if cached and cached[0] > now:
+            return [dict(row) for row in cached[1]]
+        
+        rows = load()
+        if rows:
+            if len(self._query_cache) >= QUERY_CACHE_MAX_ENTRIES:
+                # 先清掉过期条目，仍然已满时淘汰最早写入的一条
+                for expired_key in [k for k, (expires, _) in self._query_cache.items() if expires <= now]:
+                    del self._query_cache[expired_key]
+                if len(self._query_cache) >= QUERY_CACHE_MAX_ENTRIES:
+                    del self._query_cache[next(iter(self._query_cache))]
+            self._query_cache[key] = (now + self.query_cache_seconds, [dict(row) for row in rows])
+        return rows
+    
+    def invalidate_query_cache(self, table_name: str = None):
+        """清除列表查询结果缓存；不指定表名时清除全部"""
+        if table_name is None:
+            self._query_cache.clear()
+        else:
+            for key in [k for k in self._query_cache if k[0] == table_name]:
+                del self._query_cache[key]
+    
+    def get_all_stats(self, table_names: List[str] = None, exact: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        用一条 UNION ALL 查询获取多张表的统计信息，只需一次往返
+        
+        Args:
+            table_names: 表名列表，默认统计所有 rss_ 表
+            exact: 含义同 get_stats
+            
+        Returns:
+            以表名为键、get_stats 格式结果为值的字典
+        """
+        if table_names is None:
+            table_names = [t for t in _TABLE_SCHEMAS if t.startswith('rss_')]
+        if not table_names:
+            return {}
+        
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        fragments = []
+        params = []
+        for table_name in table_names:
+            sql, fragment_params = self._stats_select(table_name, today, exact, with_name=True)
+            fragments.append(sql)
+            params.extend(fragment_params)
+        
+        empty = {'total_count': 0, 'today_count': 0, 'latest_time': None}
+        try:
+            with self.session() as cursor:
+                cursor.execute(" UNION ALL ".join(fragments), tuple(params))
+                stats = {
+                    table_name: {
+                        'total_count': int(total_count or 0),
+                        'today_count': int(today_count or 0),
+                        'latest_time': latest_time
+                    }
+                    for table_name, total_count, today_count, latest_time in cursor.fetchall()
+                }
+                return {table_name: stats.get(table_name, dict(empty)) for table_name in table_names}
+        except Exception as e:
+            logger.error(f"批量获取统计信息失败: {e}")
+            return {table_name: dict(empty) for table_name in table_names}
+    
     def execute_query(self, query: str, params: tuple = ()):
         """执行单个SQL查询"""
         try:
@@ -674,50 +1289,77 @@ class DatabaseManager:
         # 由于使用上下文管理器，不需要显式关闭连接
         pass
     
-    def get_discovered_products(self, days: int = 7, deduplicate: bool = True) -> List[Dict[str, Any]]:
+    def get_discovered_products(self, days: int = 7, deduplicate: bool = True,
+                                limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         获取指定天数内发现的产品
         
         Args:
             days: 过去多少天内的数据
             deduplicate: 是否进行智能去重
+            limit: 最多返回的产品数（按创建时间从新到旧）
             
         Returns:
             产品列表
         """
+        results = self._cached_rows(
+            ('discovered_products', 'list', days, deduplicate, limit),
+            lambda: _share_strings(list(self.iter_discovered_products(days, deduplicate, limit)),
+                                   _PRODUCT_SHARED_COLUMNS))
+        logger.info(f"获取到 {len(results)} 个产品 (过去 {days} 天，去重: {deduplicate})")
+        return results
+    
+    def iter_discovered_products(self, days: int = 7, deduplicate: bool = True,
+                                 limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        逐条返回指定天数内发现的产品
+        
+        使用服务端游标流式读取，内存占用与结果集大小无关；迭代结束前会占用一个数据库连接。
+        
+        Args:
+            days: 过去多少天内的数据
+            deduplicate: 是否进行智能去重
+            limit: 最多返回的产品数（按创建时间从新到旧）
+        """
         try:
             with self.get_connection() as conn:
-                with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+                # 普通元组游标 + 一次性读取列名，避免 DictCursor 逐行构造字典的开销
+                with conn.cursor(db_driver.cursors.SSCursor) as cursor:
+                    columns_sql = ', '.join(_PRODUCT_LIST_COLUMNS)
                     if deduplicate:
-                        # 智能去重：同一产品名称只保留最新的记录
-                        query = """
-                            SELECT dp1.* FROM discovered_products dp1
-                            INNER JOIN (
-                                SELECT product_name, MAX(created_at) as max_created_at
-                                FROM discovered_products 
-                                WHERE created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
-                                GROUP BY LOWER(TRIM(product_name))
-                            ) dp2 ON dp1.product_name = dp2.product_name 
-                                AND dp1.created_at = dp2.max_created_at
-                            ORDER BY dp1.created_at DESC
+                        # 智能去重：同一产品名称只保留最新的记录（窗口函数单次扫描，无需自连接）
+                        query = f"""
+                            SELECT {columns_sql} FROM (
+                                SELECT {columns_sql},
+                                       ROW_NUMBER() OVER (PARTITION BY product_name_norm ORDER BY created_at DESC) AS rn
+                                FROM discovered_products
+                                WHERE created_at >= %s
+                            ) t
+                            WHERE rn = 1
+                            ORDER BY created_at DESC
                         """
                     else:
                         # 不去重，返回所有记录
-                        query = """
-                            SELECT * FROM discovered_products 
-                            WHERE created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
+                        query = f"""
+                            SELECT {columns_sql} FROM discovered_products 
+                            WHERE created_at >= %s
                             ORDER BY created_at DESC
                         """
                     
-                    cursor.execute(query, (days,))
-                    results = cursor.fetchall()
-                    logger.info(f"获取到 {len(results)} 个产品 (过去 {days} 天，去重: {deduplicate})")
-                    return results
+                    params = [_time_cutoff(days=days)]
+                    if limit is not None:
+                        # 由数据库提前结束排序（不去重时可沿 idx_created_at 倒序读够即停），不再把整个窗口传回客户端
+                        query += " LIMIT %s"
+                        params.append(limit)
+                    cursor.execute(query, tuple(params))
+                    columns = [desc[0] for desc in cursor.description]
+                    for row in cursor:
+                        yield dict(zip(columns, row))
         except Exception as e:
             logger.error(f"获取产品数据失败: {e}")
-            return []
 
-    def get_discovered_products_with_advanced_dedup(self, days: int = 7) -> List[Dict[str, Any]]:
+    def get_discovered_products_with_advanced_dedup(self, days: int = 7,
+                                                    limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         获取指定天数内发现的产品，使用高级去重策略
         
@@ -728,18 +1370,25 @@ class DatabaseManager:
         
         Args:
             days: 过去多少天内的数据
+            limit: 最多返回的产品数（按创建时间从新到旧）
             
         Returns:
             去重后的产品列表
         """
+        return self._cached_rows(('discovered_products', 'advanced', days, limit),
+                                 lambda: self._query_products_with_advanced_dedup(days, limit))
+
+    def _query_products_with_advanced_dedup(self, days: int, limit: Optional[int]) -> List[Dict[str, Any]]:
+        """执行 get_discovered_products_with_advanced_dedup 的查询（不经过结果缓存）"""
         try:
             with self.get_connection() as conn:
-                with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-                    query = """
-                        SELECT dp1.* FROM discovered_products dp1
+                with conn.cursor(db_driver.cursors.DictCursor) as cursor:
+                    columns_sql = ', '.join(f"dp1.{col}" for col in _PRODUCT_LIST_COLUMNS)
+                    query = f"""
+                        SELECT {columns_sql} FROM discovered_products dp1
                         INNER JOIN (
                             SELECT 
-                                LOWER(TRIM(product_name)) as normalized_name,
+                                product_name_norm as normalized_name,
                                 MAX(
                                     CASE 
                                         WHEN product_url IS NOT NULL AND product_url != '' THEN created_at + INTERVAL 1 DAY
@@ -747,9 +1396,9 @@ class DatabaseManager:
                                     END
                                 ) as priority_created_at
                             FROM discovered_products 
-                            WHERE created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
-                            GROUP BY LOWER(TRIM(product_name))
-                        ) dp2 ON LOWER(TRIM(dp1.product_name)) = dp2.normalized_name 
+                            WHERE created_at >= %s
+                            GROUP BY product_name_norm
+                        ) dp2 ON dp1.product_name_norm = dp2.normalized_name 
                             AND (
                                 (dp1.product_url IS NOT NULL AND dp1.product_url != '' AND dp1.created_at + INTERVAL 1 DAY = dp2.priority_created_at)
                                 OR (dp1.created_at = dp2.priority_created_at)
@@ -757,14 +1406,18 @@ class DatabaseManager:
                         ORDER BY dp1.created_at DESC
                     """
                     
-                    cursor.execute(query, (days,))
-                    results = cursor.fetchall()
+                    params = [_time_cutoff(days=days)]
+                    if limit is not None:
+                        query += " LIMIT %s"
+                        params.append(limit)
+                    cursor.execute(query, tuple(params))
+                    results = _share_strings(cursor.fetchall(), _PRODUCT_SHARED_COLUMNS)
                     logger.info(f"高级去重后获取到 {len(results)} 个唯一产品 (过去 {days} 天)")
                     return results
         except Exception as e:
             logger.error(f"高级去重获取产品数据失败: {e}")
             # 如果高级去重失败，回退到简单去重
-            return self.get_discovered_products(days, deduplicate=True)
+            return self.get_discovered_products(days, deduplicate=True, limit=limit)
 
     def cleanup_duplicate_products(self, dry_run: bool = True) -> Dict[str, Any]:
         """
@@ -778,53 +1431,58 @@ class DatabaseManager:
         """
         try:
             with self.get_connection() as conn:
-                with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-                    # 查找重复的产品（基于产品名称，忽略大小写和前后空格）
-                    cursor.execute("""
-                        SELECT 
-                            LOWER(TRIM(product_name)) as normalized_name,
-                            COUNT(*) as count,
-                            GROUP_CONCAT(id ORDER BY created_at DESC) as ids
-                        FROM discovered_products 
-                        GROUP BY LOWER(TRIM(product_name))
-                        HAVING COUNT(*) > 1
-                        ORDER BY count DESC
-                    """)
-                    
-                    duplicates = cursor.fetchall()
-                    total_duplicates = sum(dup['count'] - 1 for dup in duplicates)
-                    
+                with conn.cursor(db_driver.cursors.DictCursor) as cursor:
                     if dry_run:
+                        # GROUP_CONCAT 默认只保留1024字节，放宽限制以免大的重复组ID列表被截断
+                        cursor.execute("SET SESSION group_concat_max_len = 1048576")
+                        # 查找重复的产品（基于产品名称，忽略大小写和前后空格）
+                        cursor.execute("""
+                            SELECT 
+                                product_name_norm as normalized_name,
+                                COUNT(*) as count,
+                                GROUP_CONCAT(id ORDER BY created_at DESC) as ids
+                            FROM discovered_products 
+                            GROUP BY product_name_norm
+                            HAVING COUNT(*) > 1
+                            ORDER BY count DESC
+                        """)
+                        
+                        duplicates = cursor.fetchall()
+                        total_duplicates = sum(dup['count'] - 1 for dup in duplicates)
+                        
                         logger.info(f"发现 {len(duplicates)} 组重复产品，共 {total_duplicates} 条重复记录")
+                        # 只解析返回的示例组的ID列表
+                        samples = duplicates[:10]
+                        for dup in samples:
+                            dup['ids'] = list(map(int, dup['ids'].split(',')))
                         return {
                             'success': True,
                             'dry_run': True,
                             'duplicate_groups': len(duplicates),
                             'total_duplicates': total_duplicates,
-                            'duplicates': duplicates[:10]  # 返回前10组作为示例
+                            'duplicates': samples  # 返回前10组作为示例
                         }
                     
-                    # 实际删除重复记录（保留每组中最新的记录）
-                    deleted_count = 0
-                    for dup in duplicates:
-                        ids = dup['ids'].split(',')
-                        # 保留第一个ID（最新的），删除其他的
-                        ids_to_delete = ids[1:]
-                        if ids_to_delete:
-                            placeholders = ','.join(['%s'] * len(ids_to_delete))
-                            cursor.execute(f"""
-                                DELETE FROM discovered_products 
-                                WHERE id IN ({placeholders})
-                            """, ids_to_delete)
-                            deleted_count += cursor.rowcount
+                    # 实际删除重复记录（保留每组中最新的记录），在服务端一条语句完成
+                    cursor.execute("""
+                        DELETE dp FROM discovered_products dp
+                        INNER JOIN (
+                            SELECT id, ROW_NUMBER() OVER (
+                                PARTITION BY product_name_norm ORDER BY created_at DESC, id DESC
+                            ) AS rn
+                            FROM discovered_products
+                        ) ranked ON dp.id = ranked.id
+                        WHERE ranked.rn > 1
+                    """)
+                    deleted_count = cursor.rowcount
                     
                     conn.commit()
+                    self.invalidate_query_cache('discovered_products')
                     logger.info(f"清理完成，删除了 {deleted_count} 条重复记录")
                     
                     return {
                         'success': True,
                         'dry_run': False,
-                        'duplicate_groups': len(duplicates),
                         'deleted_count': deleted_count
                     }
                     
@@ -835,44 +1493,116 @@ class DatabaseManager:
                 'error': str(e)
             }
     
-    def get_articles_for_analysis(self, days: int = 7) -> List[Dict[str, Any]]:
+    def _iter_rows(self, query: str, params: tuple, error_message: str) -> Iterator[Dict[str, Any]]:
+        """
+        用服务端游标逐行返回查询结果（字典形式）
+        
+        迭代结束前会一直占用一个数据库连接，调用方应迭代完毕或显式关闭生成器。
+        查询失败时记录错误并结束迭代。
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor(db_driver.cursors.SSDictCursor) as cursor:
+                    cursor.execute(query, params)
+                    yield from cursor
+        except Exception as e:
+            logger.error(f"{error_message}: {e}")
+    
+    @staticmethod
+    def _with_source_table(rows: Iterator[Dict[str, Any]], table_names: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        把多表 UNION ALL 查询中的分支序号 source_idx 还原为 source_table 表名
+        
+        表名不再作为字符串列逐行从数据库传回；所有行共享同一个驻留的表名对象。
+        """
+        sources = [sys.intern(table_name) for table_name in table_names]
+        for row in rows:
+            row['source_table'] = sources[row.pop('source_idx')]
+            yield row
+    
+    def get_articles_for_analysis(self, days: int = 7, include_content: bool = False,
+                                  since: Optional[datetime] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         获取指定天数内的文章用于分析
         
         Args:
             days: 过去多少天内的数据
+            include_content: 是否同时读取正文 content（大字段，默认不读取）
+            since: 只获取该时间之后创建的文章（用于增量读取，指定时忽略 days）
+            limit: 最多返回的文章数（按创建时间从新到旧）
             
         Returns:
             文章列表
         """
-        try:
-            with self.get_connection() as conn:
-                with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-                    query = """
-                        SELECT * FROM articles 
-                        WHERE created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
-                        ORDER BY created_at DESC
-                    """
-                    cursor.execute(query, (days,))
-                    results = cursor.fetchall()
-                    logger.info(f"获取到 {len(results)} 篇文章用于分析 (过去 {days} 天)")
-                    return results
-        except Exception as e:
-            logger.error(f"获取文章数据失败: {e}")
-            return []
+        results = self._cached_rows(
+            ('articles', 'analysis', days, include_content, since, limit),
+            lambda: list(self.iter_articles_for_analysis(days, include_content, since, limit)))
+        window = f"{since} 之后" if since is not None else f"过去 {days} 天"
+        logger.info(f"获取到 {len(results)} 篇文章用于分析 ({window})")
+        return results
+    
+    def iter_articles_for_analysis(self, days: int = 7, include_content: bool = False,
+                                   since: Optional[datetime] = None,
+                                   limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """逐条返回指定天数内的文章，参数同 get_articles_for_analysis，流式读取见 _iter_rows"""
+        columns = _ARTICLE_LIST_COLUMNS + ('content',) if include_content else _ARTICLE_LIST_COLUMNS
+        if since is not None:
+            where_sql = "created_at > %s"
+            params = [since]
+        else:
+            where_sql = "created_at >= %s"
+            params = [_time_cutoff(days=days)]
+        # 沿 idx_created_at 倒序扫描，有 LIMIT 时读够即停，无需排序
+        query = f"""
+            SELECT {', '.join(columns)} FROM articles 
+            WHERE {where_sql}
+            ORDER BY created_at DESC
+        """
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(limit)
+        return self._iter_rows(query, tuple(params), "获取文章数据失败")
     
+    def save_reports_bulk(self, table_name: str, columns: List[str], rows: List[tuple],
+                          chunk_size: int = INSERT_CHUNK_SIZE) -> int:
+        """
+        批量写入报告行，executemany 会被驱动合并为多行INSERT
+        
+        Args:
+            table_name: 报告表名
+            columns: 列名列表
+            rows: 与列顺序一致的值元组列表（JSON列需预先序列化）
+            chunk_size: 每条INSERT包含的最大行数，避免超过 max_allowed_packet
+            
+        Returns:
+            写入的行数；get_last_insert_id() 返回最后一条INSERT语句中首行的自增ID
+        """
+        if not rows:
+            return 0
+        
+        placeholders = ', '.join(['%s'] * len(columns))
+        sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+        inserted_count = 0
+        with self.session() as cursor:
+            for start in range(0, len(rows), chunk_size):
+                cursor.executemany(sql, rows[start:start + chunk_size])
+                inserted_count += cursor.rowcount
+            self._last_insert_id = cursor.lastrowid
+        return inserted_count
+
     def save_product_report(self, report_data: Dict[str, Any]):
         """
         将产品发现报告保存到数据库。
         :param report_data: 包含报告所有信息的字典。
         """
-        query = """
-            INSERT INTO product_reports (
-                report_uuid, generated_at, report_date, time_range, product_count,
-                source_feed_count, report_content_md, metadata
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s);
+        self.save_product_reports([report_data])
+
+    def save_product_reports(self, reports: List[Dict[str, Any]]) -> int:
+        """
+        批量将产品发现报告保存到数据库。
+        :param reports: 报告字典列表。
         """
-        params = (
+        rows = [(
             report_data['report_uuid'],
             report_data['generated_at'],
             report_data['report_date'],
@@ -880,57 +1610,71 @@ class DatabaseManager:
             report_data.get('product_count'),
             report_data.get('source_feed_count'),
             report_data.get('report_content_md'),
-            json.dumps(report_data.get('metadata')) if report_data.get('metadata') else None
-        )
-        self.execute_query(query, params)
-        logger.info(f"产品发现报告 {report_data['report_uuid']} 已成功存入数据库。")
+            _json_or_none(report_data.get('metadata'))
+        ) for report_data in reports]
+        count = self.save_reports_bulk('product_reports', [
+            'report_uuid', 'generated_at', 'report_date', 'time_range', 'product_count',
+            'source_feed_count', 'report_content_md', 'metadata'
+        ], rows)
+        logger.info(f"产品发现报告 {', '.join(r['report_uuid'] for r in reports)} 已成功存入数据库。")
+        return count
 
     def save_technews_report(self, report_data: Dict[str, Any]):
         """
         将科技新闻报告保存到数据库。
         :param report_data: 包含报告所有信息的字典。
         """
-        query = """
-            INSERT INTO technews_reports (
-                report_uuid, generated_at, report_date, time_range, article_count,
-                main_topics, report_content_md, metadata
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s);
+        self.save_technews_reports([report_data])
+
+    def save_technews_reports(self, reports: List[Dict[str, Any]]) -> int:
+        """
+        批量将科技新闻报告保存到数据库。
+        :param reports: 报告字典列表。
         """
-        params = (
+        rows = [(
             report_data['report_uuid'],
             report_data['generated_at'],
             report_data['report_date'],
             report_data.get('time_range'),
             report_data.get('article_count'),
-            json.dumps(report_data.get('main_topics')) if report_data.get('main_topics') else None,
+            _json_or_none(report_data.get('main_topics')),
             report_data.get('report_content_md'),
-            json.dumps(report_data.get('metadata')) if report_data.get('metadata') else None
-        )
-        self.execute_query(query, params)
-        logger.info(f"科技新闻报告 {report_data['report_uuid']} 已成功存入数据库。")
+            _json_or_none(report_data.get('metadata'))
+        ) for report_data in reports]
+        count = self.save_reports_bulk('technews_reports', [
+            'report_uuid', 'generated_at', 'report_date', 'time_range', 'article_count',
+            'main_topics', 'report_content_md', 'metadata'
+        ], rows)
+        logger.info(f"科技新闻报告 {', '.join(r['report_uuid'] for r in reports)} 已成功存入数据库。")
+        return count
 
     def save_insights_report(self, report_data: Dict[str, Any]):
         """
         将深度洞察报告保存到数据库。
         :param report_data: 包含报告所有信息的字典。
         """
-        query = """
-            INSERT INTO insights_reports (
-                report_uuid, generated_at, report_date, report_title,
-                related_report_uuids, report_content_md, metadata
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s);
+        self.save_insights_reports([report_data])
+
+    def save_insights_reports(self, reports: List[Dict[str, Any]]) -> int:
+        """
+        批量将深度洞察报告保存到数据库。
+        :param reports: 报告字典列表。
         """
-        params = (
+        rows = [(
             report_data['report_uuid'],
             report_data['generated_at'],
             report_data['report_date'],
             report_data.get('report_title'),
-            json.dumps(report_data.get('related_report_uuids')) if report_data.get('related_report_uuids') else None,
+            _json_or_none(report_data.get('related_report_uuids')),
             report_data.get('report_content_md'),
-            json.dumps(report_data.get('metadata')) if report_data.get('metadata') else None
-        )
-        self.execute_query(query, params)
-        logger.info(f"深度洞察报告 {report_data['report_uuid']} 已成功存入数据库。")
+            _json_or_none(report_data.get('metadata'))
+        ) for report_data in reports]
+        count = self.save_reports_bulk('insights_reports', [
+            'report_uuid', 'generated_at', 'report_date', 'report_title',
+            'related_report_uuids', 'report_content_md', 'metadata'
+        ], rows)
+        logger.info(f"深度洞察报告 {', '.join(r['report_uuid'] for r in reports)} 已成功存入数据库。")
+        return count
 
     # 深度分析相关的数据库操作方法
     
@@ -948,37 +1692,44 @@ class DatabaseManager:
         if table_names is None:
             table_names = ['rss_indiehackers', 'rss_ezindie']
         
-        all_articles = []
-        
+        all_articles = list(self.iter_articles_for_deep_analysis(table_names, limit))
         for table_name in table_names:
-            try:
-                with self.get_connection() as conn:
-                    with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-                        # 根据表名选择合适的内容字段
-                        if table_name == 'rss_ezindie':
-                            content_field = 'full_content_markdown'
-                        else:
-                            content_field = 'full_content'
-                        
-                        # 查询待分析的文章（deep_analysis_status = 0 或 NULL）
-                        query = f"""
-                            SELECT *, '{table_name}' as source_table, {content_field} as full_content
-                            FROM {table_name} 
-                            WHERE (deep_analysis_status = 0 OR deep_analysis_status IS NULL)
-                            AND {content_field} IS NOT NULL 
-                            AND LENGTH({content_field}) > 100
-                            ORDER BY published_at DESC 
-                            LIMIT %s
-                        """
-                        cursor.execute(query, (limit,))
-                        articles = cursor.fetchall()
-                        all_articles.extend(articles)
-                        logger.info(f"从 {table_name} 获取到 {len(articles)} 篇待分析文章")
-            except Exception as e:
-                logger.error(f"从 {table_name} 获取文章失败: {e}")
+            count = sum(1 for article in all_articles if article['source_table'] == table_name)
+            logger.info(f"从 {table_name} 获取到 {count} 篇待分析文章")
         
         return all_articles
     
+    def iter_articles_for_deep_analysis(self, table_names: List[str] = None, limit: int = 50) -> Iterator[Dict[str, Any]]:
+        """逐条返回需要进行深度分析的文章，参数同 get_articles_for_deep_analysis，流式读取见 _iter_rows"""
+        if table_names is None:
+            table_names = ['rss_indiehackers', 'rss_ezindie']
+        if not table_names:
+            return iter(())
+        
+        # 每张表一个分支（各自排序和限量），用 UNION ALL 合并为一次查询；
+        # 各表列不同，因此显式列出公共列
+        fragments = []
+        params = []
+        for source_idx, table_name in enumerate(table_names):
+            # 根据表名选择合适的内容字段
+            content_field = _DEEP_ANALYSIS_CONTENT_FIELDS.get(table_name, 'full_content')
+            # 查询待分析的文章（deep_analysis_status = 0 或 NULL）
+            fragments.append(f"""
+                (SELECT id, title, link, author, summary, published_at, created_at,
+                        {source_idx} as source_idx, {content_field} as full_content
+                FROM {table_name} 
+                WHERE (deep_analysis_status = 0 OR deep_analysis_status IS NULL)
+                AND {content_field} IS NOT NULL 
+                AND LENGTH({content_field}) > 100
+                ORDER BY published_at DESC 
+                LIMIT %s)
+            """)
+            params.append(limit)
+        
+        query = " UNION ALL ".join(fragments) + " ORDER BY source_idx, published_at DESC"
+        return self._with_source_table(
+            self._iter_rows(query, tuple(params), "获取待分析文章失败"), table_names)
+    
     def update_deep_analysis_result(self, table_name: str, article_id: int, analysis_data: str, status: int = 1):
         """
         更新文章的深度分析结果
@@ -1018,94 +1769,109 @@ class DatabaseManager:
         if table_names is None:
             table_names = ['rss_indiehackers', 'rss_ezindie']
         
-        all_articles = []
+        all_articles = list(self.iter_analyzed_articles_for_synthesis(
+            table_names, days, indiehackers_hours, ezindie_limit))
         
+        # 根据查询条件记录不同的日志
         for table_name in table_names:
-            try:
-                with self.get_connection() as conn:
-                    with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-                        
-                        # 根据表名设置不同的查询条件
-                        if table_name == 'rss_indiehackers' and indiehackers_hours is not None:
-                            # indiehackers 使用小时限制 (created_at, updated_at, or published_at)
-                            query = f"""
-                                SELECT id, title, link, deep_analysis_data, published_at, created_at, updated_at, '{table_name}' as source_table
-                                FROM {table_name} 
-                                WHERE deep_analysis_status = 1 
-                                AND deep_analysis_data IS NOT NULL
-                                AND (
-                                    created_at >= DATE_SUB(NOW(), INTERVAL %s HOUR) OR
-                                    updated_at >= DATE_SUB(NOW(), INTERVAL %s HOUR) OR
-                                    published_at >= DATE_SUB(NOW(), INTERVAL %s HOUR)
-                                )
-                                ORDER BY published_at DESC
-                            """
-                            cursor.execute(query, (indiehackers_hours, indiehackers_hours, indiehackers_hours))
-                            
-                        elif table_name == 'rss_ezindie' and ezindie_limit is not None:
-                            # ezindie 使用数量限制
-                            query = f"""
-                                SELECT id, title, link, deep_analysis_data, published_at, '{table_name}' as source_table
-                                FROM {table_name} 
-                                WHERE deep_analysis_status = 1 
-                                AND deep_analysis_data IS NOT NULL
-                                ORDER BY published_at DESC
-                                LIMIT %s
-                            """
-                            cursor.execute(query, (ezindie_limit,))
-                            
-                        else:
-                            # 默认使用天数限制
-                            query = f"""
-                                SELECT id, title, link, deep_analysis_data, published_at, '{table_name}' as source_table
-                                FROM {table_name} 
-                                WHERE deep_analysis_status = 1 
-                                AND deep_analysis_data IS NOT NULL
-                                AND published_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
-                                ORDER BY published_at DESC
-                            """
-                            cursor.execute(query, (days,))
-                        
-                        articles = cursor.fetchall()
-                        all_articles.extend(articles)
-                        
-                        # 根据查询条件记录不同的日志
-                        if table_name == 'rss_indiehackers' and indiehackers_hours is not None:
-                            logger.info(f"从 {table_name} 获取到 {len(articles)} 篇已分析文章（过去{indiehackers_hours}小时）")
-                        elif table_name == 'rss_ezindie' and ezindie_limit is not None:
-                            logger.info(f"从 {table_name} 获取到 {len(articles)} 篇已分析文章（最新{ezindie_limit}篇）")
-                        else:
-                            logger.info(f"从 {table_name} 获取到 {len(articles)} 篇已分析文章（过去{days}天）")
-                            
-            except Exception as e:
-                logger.error(f"从 {table_name} 获取已分析文章失败: {e}")
+            count = sum(1 for article in all_articles if article['source_table'] == table_name)
+            if table_name == 'rss_indiehackers' and indiehackers_hours is not None:
+                logger.info(f"从 {table_name} 获取到 {count} 篇已分析文章（过去{indiehackers_hours}小时）")
+            elif table_name == 'rss_ezindie' and ezindie_limit is not None:
+                logger.info(f"从 {table_name} 获取到 {count} 篇已分析文章（最新{ezindie_limit}篇）")
+            else:
+                logger.info(f"从 {table_name} 获取到 {count} 篇已分析文章（过去{days}天）")
         
         return all_articles
     
+    def iter_analyzed_articles_for_synthesis(self, table_names: List[str] = None, days: int = 7,
+                                             indiehackers_hours: int = None,
+                                             ezindie_limit: int = None) -> Iterator[Dict[str, Any]]:
+        """逐条返回已分析的文章，参数同 get_analyzed_articles_for_synthesis，流式读取见 _iter_rows"""
+        if table_names is None:
+            table_names = ['rss_indiehackers', 'rss_ezindie']
+        if not table_names:
+            return iter(())
+        
+        # 每张表一个分支（各自的时间/数量条件），用 UNION ALL 合并为一次查询
+        fragments = []
+        params = []
+        for source_idx, table_name in enumerate(table_names):
+            select_sql = f"""
+                SELECT id, title, link, deep_analysis_data, published_at, created_at, {source_idx} as source_idx
+                FROM {table_name} 
+                WHERE deep_analysis_status = 1 
+                AND deep_analysis_data IS NOT NULL
+            """
+            
+            # 根据表名设置不同的查询条件
+            if table_name == 'rss_indiehackers' and indiehackers_hours is not None:
+                # indiehackers 使用小时限制 (created_at, updated_at, or published_at)
+                fragments.append(f"""({select_sql}
+                    AND (
+                        created_at >= %s OR
+                        updated_at >= %s OR
+                        published_at >= %s
+                    ))
+                """)
+                cutoff = _time_cutoff(hours=indiehackers_hours)
+                params.extend((cutoff, cutoff, cutoff))
+                
+            elif table_name == 'rss_ezindie' and ezindie_limit is not None:
+                # ezindie 使用数量限制
+                fragments.append(f"""({select_sql}
+                    ORDER BY published_at DESC
+                    LIMIT %s)
+                """)
+                params.append(ezindie_limit)
+                
+            else:
+                # 默认使用天数限制
+                fragments.append(f"""({select_sql}
+                    AND published_at >= %s)
+                """)
+                params.append(_time_cutoff(days=days))
+        
+        query = " UNION ALL ".join(fragments) + " ORDER BY source_idx, published_at DESC"
+        return self._with_source_table(
+            self._iter_rows(query, tuple(params), "获取已分析文章失败"), table_names)
+    
     def save_synthesis_report(self, report_data: Dict[str, Any]):
         """
         保存综合洞察报告
         
         Args:
             report_data: 报告数据字典
+            
+        Returns:
+            新报告的ID
+        """
+        self.save_synthesis_reports([report_data])
+        report_id = self.get_last_insert_id()
+        logger.info(f"综合洞察报告 {report_id} 已成功存入数据库")
+        return report_id
+
+    def save_synthesis_reports(self, reports: List[Dict[str, Any]]) -> int:
         """
+        批量保存综合洞察报告，单个事务内用多行INSERT写入
+        
+        Args:
+            reports: 报告数据字典列表
+            
+        Returns:
+            写入的行数
+        """
+        rows = [(
+            report_data.get('report_type', 'community_insights'),
+            report_data.get('start_date'),
+            report_data.get('end_date'),
+            report_data.get('content'),
+            _json_dumps(report_data.get('source_article_ids', []))
+        ) for report_data in reports]
         try:
-            query = """
-                INSERT INTO synthesis_reports (
-                    report_type, start_date, end_date, content, source_article_ids
-                ) VALUES (%s, %s, %s, %s, %s)
-            """
-            params = (
-                report_data.get('report_type', 'community_insights'),
-                report_data.get('start_date'),
-                report_data.get('end_date'),
-                report_data.get('content'),
-                json.dumps(report_data.get('source_article_ids', []))
-            )
-            self.execute_query(query, params)
-            report_id = self.get_last_insert_id()
-            logger.info(f"综合洞察报告 {report_id} 已成功存入数据库")
-            return report_id
+            return self.save_reports_bulk('synthesis_reports', [
+                'report_type', 'start_date', 'end_date', 'content', 'source_article_ids'
+            ], rows)
         except Exception as e:
             logger.error(f"保存综合洞察报告失败: {e}")
             raise
@@ -1123,7 +1889,7 @@ class DatabaseManager:
         """
         try:
             with self.get_connection() as conn:
-                with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+                with conn.cursor(db_driver.cursors.DictCursor) as cursor:
                     if report_type:
                         query = """
                             SELECT id, report_type, start_date, end_date, content, 
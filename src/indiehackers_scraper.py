@@ -1,222 +1,411 @@
+import argparse
 import asyncio
+from contextlib import asynccontextmanager
 from playwright.async_api import async_playwright
 from playwright_stealth import stealth_async
 from bs4 import BeautifulSoup
-import html2text
-from urllib.parse import urljoin
+from lxml import etree
+import lxml.html
+import re
+from urllib.parse import urljoin, urlsplit
+
+from .config import config
 
 BASE_URL = "https://www.indiehackers.com"
 # Set a max number of clicks to prevent infinite loops in case of a bug
 MAX_LOAD_MORE_CLICKS = 5 
+# 解析只依赖DOM，这些资源类型直接拦截以减少网络等待
+# 样式表保留：Load More/Cookie按钮的is_visible判断依赖计算样式
+BLOCKED_RESOURCE_TYPES = frozenset(('image', 'media', 'font'))
+# 第三方统计/广告域名（含子域名），这些请求会一直拖延 networkidle
+BLOCKED_HOSTS = ('google-analytics.com', 'googletagmanager.com', 'segment.io', 'segment.com', 'doubleclick.net')
+# 解析器关心的列表项，点击Load More后以其数量增长作为新内容已加载的信号
+LOADED_ITEMS_SELECTOR = 'div.product-card, li.top-product, div.feed-item--post'
+# SPA内容渲染完成的信号：任一选择器出现即可开始解析
+# 不含 '.ember-view div'、'div[class*="card"]' 这类应用外壳就能匹配的宽泛选择器
+CONTENT_READY_SELECTORS = [
+    LOADED_ITEMS_SELECTOR,
+    'div[class*="product"]',
+    'div[data-testid*="product"]',
+    'article',
+    'div[class*="feed-item"]',
+    'li[class*="product"]',
+]
+# 在页面内一次性检查/统计所有内容选择器，避免逐个选择器往返CDP
+_JS_ANY_SELECTOR_PRESENT = "(sels) => sels.some(s => document.querySelector(s) !== null)"
+_JS_COUNT_SELECTORS = "(sels) => sels.map(s => document.querySelectorAll(s).length)"
+# 共享浏览器中同时打开的最大页面数
+MAX_CONCURRENT_PAGES = 4
+# --serve 模式下常驻Chromium开放的CDP端口
+DEFAULT_CDP_PORT = 9222
+# 共享BrowserContext的模板参数：UA/视口/语言在创建上下文时设置一次，所有页面沿用
+CONTEXT_OPTIONS = {
+    'user_agent': ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                   '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'),
+    'viewport': {'width': 1366, 'height': 900},
+    'locale': 'en-US',
+}
+
+
+def _has_class(name: str) -> str:
+    """生成等价于CSS `.name` 的XPath谓词（按空白分隔的class精确匹配）"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# 预编译的XPath表达式：模块加载时编译一次，在C层执行，避免BS4逐节点包装Python对象
+# 每项为 (原CSS选择器, XPath)，CSS写法仅用于日志输出
+# 产品页（选择器与对应的解析函数见 _PRODUCT_PARSERS）
+_XP_PRODUCT_CARD = etree.XPath(f"//div[{_has_class('product-card')}]")  # 主要的产品卡片
+_XP_TOP_PRODUCT = etree.XPath(f"//li[{_has_class('top-product')}]")  # 顶部产品列表
+_XP_CARD_NAME = etree.XPath(f".//span[{_has_class('product-card__name')}]")
+_XP_CARD_LINK = etree.XPath(f".//a[{_has_class('product-card__link')}]")
+_XP_CARD_TAGLINE = etree.XPath(f".//span[{_has_class('product-card__tagline')}]")
+_XP_CARD_REVENUE = etree.XPath(f".//span[{_has_class('product-card__revenue-number')}]")
+_XP_TOP_LINK = etree.XPath(f".//a[{_has_class('top-product__link')}]")
+# 顶部产品标题的排名数字前缀（如 "1AiDD..." -> "AiDD..."）
+_RANK_PREFIX_RE = re.compile(r'^(\d+)(.+)')
+
+# 群组页：尝试多种可能的选择器，适应SPA应用
+_THREAD_SELECTORS = [(css, etree.XPath(xpath)) for css, xpath in (
+    ('div.feed-item--post', f"//div[{_has_class('feed-item--post')}]"),  # 原始选择器
+    ('div[class*="feed-item"]', "//div[contains(@class, 'feed-item')]"),  # 包含feed-item的class
+    ('article', "//article"),  # 文章元素
+    ('div[class*="post"]', "//div[contains(@class, 'post')]"),  # 包含post的class
+    ('li[class*="post"]', "//li[contains(@class, 'post')]"),  # 列表项post
+    ('div[class*="thread"]', "//div[contains(@class, 'thread')]"),  # 包含thread的class
+    ('div.ember-view div', f"//div[{_has_class('ember-view')}]//div"),  # Ember应用的嵌套结构
+    ('div[data-testid*="post"]', "//div[contains(@data-testid, 'post')]"),  # testid相关
+)]
+_TITLE_SELECTORS = [etree.XPath(xpath) for xpath in (
+    f".//a[{_has_class('feed-item__title-link')}]",  # 原始选择器
+    ".//a[contains(@class, 'title')]",  # 包含title的链接
+    ".//h2//a", ".//h3//a", ".//h4//a",  # 各种标题级别的链接
+    f".//*[{_has_class('title')}]//a",  # title class下的链接
+    ".//div[contains(@class, 'title')]//a",  # title div下的链接
+    ".//a[contains(@class, 'feed-item')]",  # feed-item相关链接
+    ".//a[contains(@href, '/post/')]",  # 指向post的链接
+    ".//a[contains(@href, '/thread/')]",  # 指向thread的链接
+)]
+_SUMMARY_SELECTORS = [etree.XPath(xpath) for xpath in (
+    ".//p[contains(@class, 'description')]",
+    ".//div[contains(@class, 'summary')]",
+    f".//*[{_has_class('content')}]//p",
+    ".//p",
+)]
+_AUTHOR_SELECTORS = [etree.XPath(xpath) for xpath in (
+    f".//a[{_has_class('user-link--avatar-and-name')}]",  # 原始选择器
+    ".//a[contains(@class, 'user')]",  # 包含user的链接
+    f".//*[{_has_class('user')}]//a",  # user class下的链接
+    f".//*[{_has_class('author')}]//a",  # author class下的链接
+    ".//a[contains(@class, 'author')]",  # 包含author的链接
+    ".//div[contains(@class, 'user')]//a",  # user div下的链接
+    ".//span[contains(@class, 'user')]",  # user span
+    ".//div[contains(@class, 'author')]",  # author div
+)]
+
+
+def _parse_html(html: str):
+    """用lxml.html解析页面；lxml解析失败时退回BS4修复标记后再交给lxml"""
+    try:
+        return lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError) as e:
+        print(f"lxml解析失败，改用BeautifulSoup修复HTML: {e}")
+        return lxml.html.fromstring(str(BeautifulSoup(html, 'html.parser')))
+
+
+def _first(xpath: etree.XPath, node):
+    """返回XPath的第一个匹配节点（等价于select_one），无匹配时返回None"""
+    matches = xpath(node)
+    return matches[0] if matches else None
+
+
+def _text(node) -> str:
+    """等价于BS4的get_text(strip=True)：逐段去除空白后拼接"""
+    return ''.join(text.strip() for text in node.itertext())
+
+
+class BrowserPool:
+    """
+    进程内共享的Chromium实例：首次使用时启动一次，并按 CONTEXT_OPTIONS 创建一个共享的BrowserContext。
+    stealth脚本和资源拦截路由在创建上下文时注册一次，之后每次抓取只新建（并关闭）一个页面。
+
+    配置了 CHROMIUM_CDP_ENDPOINT（crawler.chromium_cdp_endpoint）时改为通过CDP连接常驻浏览器
+    （见 --serve 模式），进程重启也无需再冷启动Chromium；连接失败时回退为本地启动。
+
+    Playwright对象绑定在启动它的事件循环上；在新的事件循环中使用时会重新启动浏览器。
+    事件循环结束前应调用 close()（见 close_browser），否则浏览器进程要到解释器退出时才会结束。
+    """
+
+    def __init__(self, max_pages: int = MAX_CONCURRENT_PAGES, cdp_endpoint: str | None = None):
+        self.max_pages = max_pages
+        self.cdp_endpoint = cdp_endpoint
+        self._pw = None
+        self._browser = None
+        self._context = None
+        self._loop = None
+        self._lock = None
+        self._semaphore = None
+
+    def _bind_loop(self) -> None:
+        """切换到当前事件循环：旧循环上的浏览器已无法使用，只丢弃引用"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(self.max_pages)
+            self._pw = None
+            self._browser = None
+            self._context = None
+
+    async def _ensure_context(self):
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._pw is None:
+                    self._pw = await async_playwright().start()
+                self._browser = await self._launch_or_connect()
+                self._context = None
+            if self._context is None:
+                context = await self._browser.new_context(**CONTEXT_OPTIONS)
+                await stealth_async(context)  # 注入init script，对上下文内所有页面生效
+                await context.route("**/*", _block_heavy_resources)
+                self._context = context
+            return self._context
+
+    async def _launch_or_connect(self):
+        if self.cdp_endpoint:
+            try:
+                browser = await self._pw.chromium.connect_over_cdp(self.cdp_endpoint)
+                print(f"已连接常驻Chromium: {self.cdp_endpoint}")
+                return browser
+            except Exception as e:
+                print(f"连接常驻Chromium失败，改为本地启动: {e}")
+        print("启动共享的Chromium浏览器...")
+        return await self._pw.chromium.launch(headless=True)  # 使用headless模式以提高性能
+
+    @asynccontextmanager
+    async def page(self):
+        """在共享的BrowserContext中获取一个新页面，退出时只关闭该页面"""
+        self._bind_loop()
+        async with self._semaphore:
+            context = await self._ensure_context()
+            page = await context.new_page()
+            try:
+                yield page
+            finally:
+                await page.close()
+
+    async def close(self) -> None:
+        """关闭浏览器并停止Playwright；通过CDP连接的常驻浏览器只会断开连接，不会被关闭"""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        async with self._lock:
+            if self._context is not None:
+                await self._context.close()
+                self._context = None
+            if self._browser is not None:
+                await self._browser.close()
+                self._browser = None
+            if self._pw is not None:
+                await self._pw.stop()
+                self._pw = None
+
+
+_browser_pool = BrowserPool(cdp_endpoint=config.get_crawler_config()['chromium_cdp_endpoint'])
+
+
+async def close_browser() -> None:
+    """关闭共享浏览器；在事件循环结束前调用"""
+    await _browser_pool.close()
+
 
-async def get_html_with_playwright(url: str) -> str | None:
-    """Fetches HTML content from a URL, handling 'Load More' buttons and using stealth."""
+async def _fetch_with_page(page, url: str) -> str | None:
+    """Fetches HTML content from a URL with the given page, handling 'Load More' buttons and using stealth."""
     print(f"Fetching {url} with Playwright in stealth mode...")
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)  # 使用headless模式以提高性能
-            page = await browser.new_page()
-            
-            # 应用stealth插件
-            await stealth_async(page)
-            
-            # 访问页面，等待网络空闲以确保JavaScript加载完成
-            await page.goto(url, wait_until='networkidle', timeout=90000)
+        # 访问页面（stealth与资源拦截已在共享BrowserContext上注册）：DOM就绪即可，后续由wait_for_selector等待实际内容渲染
+        await page.goto(url, wait_until='domcontentloaded', timeout=90000)
+        
+        # 处理可能的cookie同意弹窗
+        try:
+            cookie_accept = page.locator('button:has-text("Accept All")')
+            if await cookie_accept.is_visible():
+                print("发现Cookie同意弹窗，点击Accept All...")
+                await cookie_accept.click()
+                await page.wait_for_timeout(3000)
+        except Exception as cookie_error:
+            print(f"处理Cookie弹窗时出错（可忽略）: {cookie_error}")
+        
+        # 等待SPA渲染出内容：任一内容选择器出现即返回，而不是固定等待
+        print("等待JavaScript应用加载内容...")
+        try:
+            await page.wait_for_function(_JS_ANY_SELECTOR_PRESENT, arg=CONTENT_READY_SELECTORS, timeout=15000)
+            counts = await page.evaluate(_JS_COUNT_SELECTORS, CONTENT_READY_SELECTORS)
+            for selector, count in zip(CONTENT_READY_SELECTORS, counts):
+                if count:
+                    print(f"✅ 找到 {count} 个内容元素使用选择器: {selector}")
+                    break
+        except Exception:
+            print("❌ 15秒内未找到内容元素，继续尝试解析当前页面...")
             
-            # 处理可能的cookie同意弹窗
+        # 滚动页面以触发懒加载，网络空闲或最多3秒后继续
+        await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+        try:
+            await page.wait_for_load_state('networkidle', timeout=3000)
+        except Exception:
+            pass
+
+        # 点击"Load More"按钮直到没有更多内容
+        load_more_selectors = [
+            'button:has-text("Load more")',
+            'button:has-text("Show more")', 
+            'button[class*="load"]',
+            'a:has-text("Load more")',
+            'div:has-text("Load more")',
+            '.load-more',
+            '[data-testid*="load"]'
+        ]
+        
+        # 首先找到有效的Load More选择器
+        active_selector = None
+        for selector in load_more_selectors:
             try:
-                cookie_accept = page.locator('button:has-text("Accept All")')
-                if await cookie_accept.is_visible():
-                    print("发现Cookie同意弹窗，点击Accept All...")
-                    await cookie_accept.click()
-                    await page.wait_for_timeout(3000)
-            except Exception as cookie_error:
-                print(f"处理Cookie弹窗时出错（可忽略）: {cookie_error}")
-            
-            # 等待页面JavaScript应用完全加载
-            # 对于SPA应用，需要等待更长时间让内容渲染
-            print("等待JavaScript应用加载内容...")
-            await page.wait_for_timeout(10000)  # 等待10秒让SPA加载
-            
-            # 尝试不同的产品容器选择器
-            product_selectors = [
-                'div[class*="product"]',
-                'div[data-testid*="product"]', 
-                'article',
-                'div[class*="feed-item"]',
-                'div[class*="card"]',
-                'li[class*="product"]',
-                '.ember-view div',  # Ember应用的通用选择器
-            ]
-            
-            products_found = False
-            for selector in product_selectors:
-                try:
-                    await page.wait_for_selector(selector, timeout=5000)
-                    count = await page.locator(selector).count()
-                    if count > 0:
-                        print(f"✅ 找到 {count} 个产品元素使用选择器: {selector}")
-                        products_found = True
-                        break
-                except:
-                    continue
-            
-            if not products_found:
-                print("❌ 未找到产品元素，尝试等待更长时间...")
-                await page.wait_for_timeout(5000)
-                
-            # 滚动页面以确保所有内容加载
-            await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            await page.wait_for_timeout(3000)
-
-            # 点击"Load More"按钮直到没有更多内容
-            load_more_selectors = [
-                'button:has-text("Load more")',
-                'button:has-text("Show more")', 
-                'button[class*="load"]',
-                'a:has-text("Load more")',
-                'div:has-text("Load more")',
-                '.load-more',
-                '[data-testid*="load"]'
-            ]
-            
-            # 首先找到有效的Load More选择器
-            active_selector = None
-            for selector in load_more_selectors:
+                load_more_button = page.locator(selector)
+                if await load_more_button.is_visible():
+                    active_selector = selector
+                    print(f"找到Load More按钮，使用选择器: {selector}")
+                    break
+            except:
+                continue
+        
+        if active_selector:
+            for i in range(MAX_LOAD_MORE_CLICKS):
                 try:
-                    load_more_button = page.locator(selector)
+                    load_more_button = page.locator(active_selector)
                     if await load_more_button.is_visible():
-                        active_selector = selector
-                        print(f"找到Load More按钮，使用选择器: {selector}")
-                        break
-                except:
-                    continue
-            
-            if active_selector:
-                for i in range(MAX_LOAD_MORE_CLICKS):
-                    try:
-                        load_more_button = page.locator(active_selector)
-                        if await load_more_button.is_visible():
-                            print(f"点击 'Load More' 按钮... (尝试 {i + 1})")
-                            await load_more_button.click()
-                            await page.wait_for_load_state('networkidle', timeout=15000)
-                            
-                            # 等待内容加载并检查产品数量变化
-                            await page.wait_for_timeout(2000)
-                            current_html = await page.content()
-                            from bs4 import BeautifulSoup
-                            soup_check = BeautifulSoup(current_html, 'lxml')
-                            current_top_products = soup_check.select('li.top-product')
-                            print(f"当前顶部产品数量: {len(current_top_products)}")
-                        else:
-                            print("Load More按钮不再可见，停止点击")
+                        prev_count = await page.locator(LOADED_ITEMS_SELECTOR).count()
+                        print(f"点击 'Load More' 按钮... (尝试 {i + 1})")
+                        await load_more_button.click()
+                        
+                        # 新条目出现即继续，不必等待统计/图片等请求全部结束
+                        try:
+                            await page.wait_for_function(
+                                "([selector, prev]) => document.querySelectorAll(selector).length > prev",
+                                arg=[LOADED_ITEMS_SELECTOR, prev_count],
+                                timeout=15000
+                            )
+                        except Exception:
+                            print("未检测到新条目，回退为等待网络空闲...")
+                            try:
+                                await page.wait_for_load_state('networkidle', timeout=5000)
+                            except Exception:
+                                pass
+                        
+                        current_count = await page.locator(LOADED_ITEMS_SELECTOR).count()
+                        print(f"当前条目数量: {current_count}（新增 {current_count - prev_count}）")
+                        if current_count <= prev_count:
+                            print("点击后没有新条目，停止点击")
                             break
-                    except Exception as e:
-                        print(f"点击Load More时出错: {e}")
+                    else:
+                        print("Load More按钮不再可见，停止点击")
                         break
-            else:
-                print("未找到Load More按钮")
+                except Exception as e:
+                    print(f"点击Load More时出错: {e}")
+                    break
+        else:
+            print("未找到Load More按钮")
 
-            content = await page.content()
-            await browser.close()
-            return content
+        return await page.content()
     except Exception as e:
         print(f"Error fetching {url} with Playwright: {e}")
         return None
 
+def _product_post(title: str, link: str, description: str) -> dict | None:
+    # 只有在找到有效标题时才生成结果
+    if len(title) <= 1:
+        return None
+    return {
+        'title': title,
+        'link': link,
+        'summary': description,
+        'author': 'Indie Hackers',  # Indie Hackers页面通常不显示单个作者
+        'published': None,
+        'source': 'Indie Hackers Products (Scraped)'
+    }
+
+def _parse_card(product) -> dict | None:
+    """解析产品卡片 (div.product-card)"""
+    # 标题在 span.product-card__name 中
+    title_element = _first(_XP_CARD_NAME, product)
+    if title_element is None:
+        return None
+    # 链接在 a.product-card__link 中
+    link_element = _first(_XP_CARD_LINK, product)
+    href = link_element.get('href') if link_element is not None else None
+    link = urljoin(BASE_URL, href) if href is not None else ''
+
+    # 描述在 span.product-card__tagline 中
+    description_element = _first(_XP_CARD_TAGLINE, product)
+    description = _text(description_element) if description_element is not None else ''
+
+    # 收入信息
+    revenue_element = _first(_XP_CARD_REVENUE, product)
+    revenue_text = _text(revenue_element) if revenue_element is not None else ''
+    if revenue_text:
+        description = f"{description} (Revenue: {revenue_text})"
+
+    return _product_post(_text(title_element), link, description)
+
+def _parse_top(product) -> dict | None:
+    """解析顶部产品 (li.top-product)"""
+    # 链接和标题都在 a.top-product__link 中
+    link_element = _first(_XP_TOP_LINK, product)
+    if link_element is None:
+        return None
+    href = link_element.get('href')
+    link = urljoin(BASE_URL, href) if href is not None else ''
+    # 标题是链接的文本内容，移除数字前缀（如 "1AiDD..." -> "AiDD..."）
+    title = _text(link_element)
+    title_match = _RANK_PREFIX_RE.match(title)
+    if title_match:
+        title = title_match.group(2)
+
+    return _product_post(title, link, '')  # 顶部产品通常没有详细描述
+
+# 每种产品元素由产生它的选择器决定解析函数，无需逐项检查class
+# 每项为 (原CSS选择器, XPath, 解析函数)，CSS写法仅用于日志输出
+_PRODUCT_PARSERS = [
+    ('div.product-card', _XP_PRODUCT_CARD, _parse_card),
+    ('li.top-product', _XP_TOP_PRODUCT, _parse_top),
+]
+
 def parse_products(html: str | None) -> list:
     """Parses the HTML of the Indie Hackers products page."""
     if not html:
         return []
     
-    soup = BeautifulSoup(html, 'lxml')
+    tree = _parse_html(html)
     posts = []
-    h = html2text.HTML2Text()
-    h.ignore_links = True
-
-    # 根据实际HTML结构，使用正确的选择器
-    # 1. 产品卡片 - div.product-card
-    # 2. 顶部产品 - li.top-product
-    product_selectors = [
-        'div.product-card',  # 主要的产品卡片
-        'li.top-product',    # 顶部产品列表
-    ]
-    
-    all_products = []
-    for selector in product_selectors:
-        products = soup.select(selector)
-        if products:
-            print(f"使用选择器找到 {len(products)} 个产品元素: {selector}")
-            all_products.extend(products)
-    
-    if not all_products:
-        print("未找到任何产品元素...")
-        return []
+    found = 0
 
-    print(f"总共找到 {len(all_products)} 个产品元素")
+    # 缺失的节点通过None检查跳过，只在整个循环外兜底意外错误
+    try:
+        for selector, xpath, parse_item in _PRODUCT_PARSERS:
+            products = xpath(tree)
+            if not products:
+                continue
+            print(f"使用选择器找到 {len(products)} 个产品元素: {selector}")
+            found += len(products)
+            for product in products:
+                post = parse_item(product)
+                if post is not None:
+                    posts.append(post)
+    except Exception as e:
+        print(f"Error parsing product items: {e}")
 
-    for product in all_products:
-        try:
-            # 根据实际HTML结构解析标题
-            title_element = None
-            link = ''
-            
-            # 对于产品卡片 (div.product-card)
-            if 'product-card' in product.get('class', []):
-                # 标题在 span.product-card__name 中
-                title_element = product.select_one('span.product-card__name')
-                # 链接在 a.product-card__link 中
-                link_element = product.select_one('a.product-card__link')
-                if link_element and link_element.has_attr('href'):
-                    link = urljoin(BASE_URL, link_element['href'])
-                    
-                # 描述在 span.product-card__tagline 中
-                description_element = product.select_one('span.product-card__tagline')
-                description = description_element.get_text(strip=True) if description_element else ''
-                
-                # 收入信息
-                revenue_element = product.select_one('span.product-card__revenue-number')
-                revenue_text = revenue_element.get_text(strip=True) if revenue_element else ''
-                if revenue_text:
-                    description = f"{description} (Revenue: {revenue_text})"
-            
-            # 对于顶部产品 (li.top-product)
-            elif 'top-product' in product.get('class', []):
-                # 链接和标题都在 a.top-product__link 中
-                link_element = product.select_one('a.top-product__link')
-                if link_element:
-                    if link_element.has_attr('href'):
-                        link = urljoin(BASE_URL, link_element['href'])
-                    # 标题是链接的文本内容，但需要处理格式
-                    title_text = link_element.get_text(strip=True)
-                    # 移除数字前缀（如 "1AiDD..." -> "AiDD..."）
-                    import re
-                    title_match = re.match(r'^(\d+)(.+)', title_text)
-                    if title_match:
-                        title_text = title_match.group(2)
-                    title_element = type('MockElement', (), {'get_text': lambda self, strip=False: title_text})()
-                
-                description = ''  # 顶部产品通常没有详细描述
-            
-            title = title_element.get_text(strip=True) if title_element else 'No Title'
-            
-            # 作者信息（Indie Hackers页面通常不显示单个作者）
-            author_name = 'Indie Hackers'
-            
-            # 只有在找到有效标题时才添加到结果中
-            if title and title != 'No Title' and len(title) > 1:
-                posts.append({
-                    'title': title,
-                    'link': link,
-                    'summary': description,
-                    'author': author_name,
-                    'published': None,
-                    'source': 'Indie Hackers Products (Scraped)'
-                })
-        except Exception as e:
-            print(f"Error parsing a product item: {e}")
-            continue
-            
+    if not found:
+        print("未找到任何产品元素...")
+    else:
+        print(f"总共找到 {found} 个产品元素")
     return posts
 
 def parse_groups(html: str | None) -> list:
@@ -224,26 +413,13 @@ def parse_groups(html: str | None) -> list:
     if not html:
         return []
 
-    soup = BeautifulSoup(html, 'lxml')
+    tree = _parse_html(html)
     posts = []
-    h = html2text.HTML2Text()
-    h.ignore_links = True
 
     # 尝试多种可能的群组选择器，适应SPA应用
-    thread_selectors = [
-        'div.feed-item--post',  # 原始选择器
-        'div[class*="feed-item"]',  # 包含feed-item的class
-        'article',  # 文章元素
-        'div[class*="post"]',  # 包含post的class
-        'li[class*="post"]',  # 列表项post
-        'div[class*="thread"]',  # 包含thread的class
-        'div.ember-view div',  # Ember应用的嵌套结构
-        'div[data-testid*="post"]'  # testid相关
-    ]
-    
     threads = []
-    for selector in thread_selectors:
-        threads = soup.select(selector)
+    for selector, xpath in _THREAD_SELECTORS:
+        threads = xpath(tree)
         if threads:
             print(f"使用选择器找到 {len(threads)} 个群组讨论元素: {selector}")
             break
@@ -255,63 +431,34 @@ def parse_groups(html: str | None) -> list:
     for thread in threads:
         try:
             # 尝试多种标题选择器
-            title_selectors = [
-                'a.feed-item__title-link',  # 原始选择器
-                'a[class*="title"]',  # 包含title的链接
-                'h2 a', 'h3 a', 'h4 a',  # 各种标题级别的链接
-                '.title a',  # title class下的链接
-                'div[class*="title"] a',  # title div下的链接
-                'a[class*="feed-item"]',  # feed-item相关链接
-                'a[href*="/post/"]',  # 指向post的链接
-                'a[href*="/thread/"]'  # 指向thread的链接
-            ]
-            
             title_element = None
-            for selector in title_selectors:
-                title_element = thread.select_one(selector)
-                if title_element:
+            for xpath in _TITLE_SELECTORS:
+                title_element = _first(xpath, thread)
+                if title_element is not None:
                     break
                     
-            title = title_element.get_text(strip=True) if title_element else 'No Title'
+            title = _text(title_element) if title_element is not None else 'No Title'
             
             link = ''
-            if title_element and title_element.has_attr('href'):
-                link = urljoin(BASE_URL, title_element['href'])
+            if title_element is not None and title_element.get('href') is not None:
+                link = urljoin(BASE_URL, title_element.get('href'))
 
             # 群组页面通常没有详细摘要，尝试获取简单描述
             summary = ''
-            summary_selectors = [
-                'p[class*="description"]',
-                'div[class*="summary"]',
-                '.content p',
-                'p'
-            ]
-            
-            for selector in summary_selectors:
-                summary_element = thread.select_one(selector)
-                if summary_element:
-                    summary = summary_element.get_text(strip=True)[:200]  # 限制长度
+            for xpath in _SUMMARY_SELECTORS:
+                summary_element = _first(xpath, thread)
+                if summary_element is not None:
+                    summary = _text(summary_element)[:200]  # 限制长度
                     break
 
             # 尝试多种作者选择器
-            author_selectors = [
-                'a.user-link--avatar-and-name',  # 原始选择器
-                'a[class*="user"]',  # 包含user的链接
-                '.user a',  # user class下的链接
-                '.author a',  # author class下的链接
-                'a[class*="author"]',  # 包含author的链接
-                'div[class*="user"] a',  # user div下的链接
-                'span[class*="user"]',  # user span
-                'div[class*="author"]'  # author div
-            ]
-            
             author_element = None
-            for selector in author_selectors:
-                author_element = thread.select_one(selector)
-                if author_element:
+            for xpath in _AUTHOR_SELECTORS:
+                author_element = _first(xpath, thread)
+                if author_element is not None:
                     break
                     
-            author_name = author_element.get_text(strip=True) if author_element else 'N/A'
+            author_name = _text(author_element) if author_element is not None else 'N/A'
 
             # 只有在找到标题时才添加到结果中
             if title and title != 'No Title':
@@ -329,26 +476,85 @@ def parse_groups(html: str | None) -> list:
             
     return posts
 
+def _is_blocked_host(url: str) -> bool:
+    host = urlsplit(url).hostname or ''
+    return any(host == blocked or host.endswith('.' + blocked) for blocked in BLOCKED_HOSTS)
+
+async def _block_heavy_resources(route) -> None:
+    """拦截图片/媒体/字体及第三方统计请求，其余请求正常放行"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or _is_blocked_host(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+def _job_url(kind: str, target: str) -> str:
+    """根据抓取任务类型（products/group）构造目标URL"""
+    if kind == 'products':
+        if target == 'today':
+            url = f"{BASE_URL}/products?period=day"
+        elif target == 'all-time':
+            url = f"{BASE_URL}/products"
+        else:
+            url = f"{BASE_URL}/products?period={target}"
+        print(f"Scraping Indie Hackers products for period: {target} from {url}")
+    else:
+        if target == 'saas-marketing':
+            target = 'saas'
+        url = f"{BASE_URL}/group/{target}"
+        print(f"Scraping Indie Hackers group: {target} from {url}")
+    return url
+
+async def _fetch_and_parse(kind: str, target: str) -> list:
+    """用共享浏览器中的独立页面抓取单个任务并解析结果"""
+    url = _job_url(kind, target)
+    try:
+        async with _browser_pool.page() as page:
+            html = await _fetch_with_page(page, url)
+    except Exception as e:
+        print(f"Error fetching {url} with Playwright: {e}")
+        html = None
+    return parse_products(html) if kind == 'products' else parse_groups(html)
+
+async def scrape_many(jobs: list[tuple[str, str]]) -> list[list]:
+    """
+    在共享浏览器中并发执行多个抓取任务（同时打开的页面数受 MAX_CONCURRENT_PAGES 限制）。
+
+    Args:
+        jobs: (kind, target) 列表，kind 为 'products'（target 为时间段）或 'group'（target 为群组名）
+
+    Returns:
+        与 jobs 顺序一致的结果列表，单个任务失败时对应位置为空列表
+    """
+    return list(await asyncio.gather(*[_fetch_and_parse(kind, target) for kind, target in jobs]))
+
 async def scrape_products(period: str) -> list:
     """Scrapes Indie Hackers products based on a time period."""
-    if period == 'today':
-        period_path = 'day'
-        url = f"{BASE_URL}/products?period={period_path}"
-    elif period == 'all-time':
-        url = f"{BASE_URL}/products"
-    else:
-        url = f"{BASE_URL}/products?period={period}"
-        
-    print(f"Scraping Indie Hackers products for period: {period} from {url}")
-    html = await get_html_with_playwright(url)
-    return parse_products(html)
+    return (await scrape_many([('products', period)]))[0]
 
 async def scrape_group(group_name: str) -> list:
     """Scrapes an Indie Hackers group."""
-    if group_name == 'saas-marketing':
-        group_name = 'saas'
-        
-    url = f"{BASE_URL}/group/{group_name}"
-    print(f"Scraping Indie Hackers group: {group_name} from {url}")
-    html = await get_html_with_playwright(url)
-    return parse_groups(html)
+    return (await scrape_many([('group', group_name)]))[0]
+
+async def serve_browser(port: int = DEFAULT_CDP_PORT) -> None:
+    """启动常驻Chromium并开放CDP端口，供爬虫进程通过 CHROMIUM_CDP_ENDPOINT 连接复用，直到被中断"""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, args=[f'--remote-debugging-port={port}'])
+        print(f"常驻Chromium已启动，设置 CHROMIUM_CDP_ENDPOINT=http://127.0.0.1:{port} 后爬虫将复用该浏览器")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await browser.close()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Indie Hackers 爬虫浏览器服务')
+    parser.add_argument('--serve', action='store_true', help='启动常驻Chromium并开放CDP端口')
+    parser.add_argument('--port', type=int, default=DEFAULT_CDP_PORT, help='CDP端口')
+    args = parser.parse_args()
+    if args.serve:
+        try:
+            asyncio.run(serve_browser(args.port))
+        except KeyboardInterrupt:
+            print("常驻Chromium已停止")
+    else:
+        parser.print_help()
@@ -2,15 +2,185 @@
 LLM客户端模块
 支持双层模型策略：fast_model (快速信息提取) 和 smart_model (深度分析)
 """
+import asyncio
+import functools
+import hashlib
 import logging
 import json
-from typing import Dict, Any, Optional, List
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple, Iterable, Iterator, AsyncIterable, AsyncIterator
 import httpx
+try:
+    # 可选：orjson 为C实现的JSON解析，未安装时回退到标准库 json
+    import orjson
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+try:
+    # httpx 的 HTTP/2 支持依赖 h2，未安装时使用 HTTP/1.1
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
 from .config import config
 
 logger = logging.getLogger(__name__)
 
+# 请求重试次数与指数退避的基本延迟（秒）
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 2.0
+
+# 流式请求头：声明接收SSE；X-Accel-Buffering 提示中间的反向代理/网关不要缓冲整段响应
+# （nginx 只认上游响应中的该头，这里仅对会转发/识别请求头的网关生效）
+_STREAM_HEADERS = {"Accept": "text/event-stream", "X-Accel-Buffering": "no"}
+
+# 流式响应按64KB重新分块后再交给SSE解析：整段回复只在结束后使用，合并小块可减少Python层循环次数
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 响应缓存：只缓存温度不高于该值的（近似确定性的）调用，按最近使用淘汰
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.2
+RESPONSE_CACHE_MAX_ENTRIES = 512
+
+# extract_json_from_response 使用的正则：```json 代码块；以及花括号扫描时需要关注的结构字符
+_JSON_FENCE_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL | re.IGNORECASE)
+_JSON_STRUCTURE_RE = re.compile(r'[{}"\\]')
+# 响应缓存键的规范化：连续空白折叠为单个空格，只差空白/缩进的提示词共用同一条缓存
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _iter_json_objects(text: str) -> Iterator[str]:
+    """
+    单次线性扫描，依次返回文本中每个花括号配平的完整对象片段（跳过字符串内的括号与转义字符）
+    
+    只在结构字符之间跳跃，不像贪婪的 \\{.*\\} 那样先扫到最后一个 } 再回溯。
+    """
+    start = text.find('{')
+    while start != -1:
+        depth = 0
+        in_string = False
+        escaped_pos = -1
+        end = -1
+        for match in _JSON_STRUCTURE_RE.finditer(text, start):
+            pos = match.start()
+            if pos == escaped_pos:
+                continue
+            ch = match.group()
+            if in_string:
+                if ch == '\\':
+                    escaped_pos = pos + 1
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == '{':
+                depth += 1
+            elif ch == '}':
+                depth -= 1
+                if depth == 0:
+                    end = match.end()
+                    break
+        if end == -1:
+            return
+        yield text[start:end]
+        start = text.find('{', end)
+
+
+class _SSEDecoder:
+    """
+    增量切分SSE字节流，返回各事件 data 字段的内容，遇到 [DONE] 后置 done 标记
+    
+    网络分块与SSE行边界无关，按字节缓冲后再切行，跨块的事件不会被截断丢弃。
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self.done = False
+
+    def _payload(self, line: bytes) -> Optional[bytes]:
+        if not line.startswith(b'data:'):
+            return None
+        payload = line[5:].lstrip(b' ')
+        if payload == b'[DONE]':
+            self.done = True
+            return None
+        return payload
+
+    def feed(self, raw: bytes) -> List[bytes]:
+        """写入一段原始字节，返回其中已完整的事件内容"""
+        buffer = self._buffer
+        buffer += raw
+        payloads = []
+        start = 0
+        while not self.done:
+            newline = buffer.find(b'\n', start)
+            if newline == -1:
+                break
+            payload = self._payload(bytes(buffer[start:newline]).rstrip(b'\r'))
+            start = newline + 1
+            if payload is not None:
+                payloads.append(payload)
+        del buffer[:start]
+        return payloads
+
+    def flush(self) -> List[bytes]:
+        """流结束时处理缓冲中没有换行符结尾的最后一行"""
+        if self.done:
+            return []
+        payload = self._payload(bytes(self._buffer).strip())
+        self._buffer.clear()
+        return [payload] if payload is not None else []
+
+
+def _iter_sse_payloads(byte_chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """从同步字节流中逐个返回SSE事件内容，见 _SSEDecoder"""
+    decoder = _SSEDecoder()
+    for raw in byte_chunks:
+        yield from decoder.feed(raw)
+        if decoder.done:
+            return
+    yield from decoder.flush()
+
+
+async def _aiter_sse_payloads(byte_chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """从异步字节流中逐个返回SSE事件内容，见 _SSEDecoder"""
+    decoder = _SSEDecoder()
+    async for raw in byte_chunks:
+        for payload in decoder.feed(raw):
+            yield payload
+        if decoder.done:
+            return
+    for payload in decoder.flush():
+        yield payload
+
+
+# 模型展示名规则：(小写模型名中需全部包含的子串, 展示名)，按顺序取第一条匹配的规则
+_DISPLAY_NAME_RULES: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (('gemini',), 'Gemini'),
+    (('glm', '4.5'), 'GLM4.5'),
+    (('glm',), 'GLM'),
+    (('gpt', '4'), 'GPT-4'),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _model_display_name(model_name: Optional[str]) -> str:
+    """get_model_display_name 的实现；配置的模型名有限，结果按名称缓存"""
+    if not model_name:
+        return 'LLM'
+
+    lower_name = model_name.lower()
+    for keywords, display_name in _DISPLAY_NAME_RULES:
+        if all(keyword in lower_name for keyword in keywords):
+            return display_name
+
+    return model_name
+
 
 class LLMClient:
     """统一的LLM客户端，支持快速和智能两种模型类型"""
@@ -26,20 +196,35 @@ class LLMClient:
             self.logger.error(f"LLM配置获取失败: {e}")
             raise
         
-        # 创建HTTP客户端
-        self.http_client = httpx.Client(
+        # 创建HTTP客户端；异步客户端在首次异步调用时按事件循环创建
+        self._client_kwargs = dict(
             base_url=self.llm_config['openai_base_url'],
             headers={
                 "Authorization": f"Bearer {self.llm_config['openai_api_key']}",
                 "Content-Type": "application/json",
             },
-            timeout=240.0
+            # 流式生成可能很久，但连接建立失败应尽快重试
+            timeout=httpx.Timeout(240.0, connect=10.0)
         )
+        # 连接池 + HTTP/2（已安装h2时）：分析线程并发调用时复用同一TLS会话，空闲连接保留120秒
+        self.http_client = httpx.Client(
+            **self._client_kwargs,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=120.0),
+        )
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop = None
         
         self.fast_model = self.llm_config.get('fast_model_name')
         self.smart_model = self.llm_config.get('smart_model_name')
         self.report_models = [m for m in self.llm_config.get('report_models', []) if isinstance(m, str) and m.strip()]
 
+        # 低温度调用的响应缓存：key -> (过期时间, 结果字典)
+        self.response_cache_seconds = self.llm_config.get('response_cache_seconds', 0)
+        self._resp_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._resp_cache_lock = threading.Lock()
+        self._cache_stats = {'hits': 0, 'misses': 0}
+
         self.logger.info("LLM客户端初始化成功")
         self.logger.info(f"Fast Model: {self.fast_model}")
         self.logger.info(f"Smart Model: {self.smart_model}")
@@ -53,7 +238,8 @@ class LLMClient:
         prompt: str,
         model_type: str = 'fast',
         temperature: float = 0.3,
-        model_override: Optional[str] = None
+        model_override: Optional[str] = None,
+        system_prompt: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         调用LLM进行分析
@@ -62,10 +248,89 @@ class LLMClient:
             prompt: 输入的提示词
             model_type: 模型类型，'fast' 或 'smart'
             temperature: 生成温度
+            system_prompt: 可选的固定指令，作为system消息放在最前面
+            
+        提示词应当"固定内容在前、动态内容在后"：把各次调用共享的指令/输出格式放进 system_prompt，
+        每次变化的数据放进 prompt，服务端的前缀缓存才能命中。
             
         Returns:
             LLM响应结果字典
         """
+        model_name, error_result = self._resolve_model(model_type, model_override)
+        if error_result is not None:
+            return error_result
+
+        cache_key = self._response_cache_key(prompt, model_name, temperature, system_prompt)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        result = self._make_request(prompt, model_name, temperature, system_prompt)
+        self._cache_put(cache_key, result)
+        return result
+
+    async def acall_llm(
+        self,
+        prompt: str,
+        model_type: str = 'fast',
+        temperature: float = 0.3,
+        model_override: Optional[str] = None,
+        system_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """call_llm 的异步版本，多个调用可在同一事件循环中并发执行"""
+        model_name, error_result = self._resolve_model(model_type, model_override)
+        if error_result is not None:
+            return error_result
+
+        cache_key = self._response_cache_key(prompt, model_name, temperature, system_prompt)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        result = await self._make_request_async(prompt, model_name, temperature, system_prompt)
+        self._cache_put(cache_key, result)
+        return result
+
+    def _response_cache_key(self, prompt: str, model_name: str, temperature: float,
+                            system_prompt: Optional[str] = None) -> Optional[str]:
+        """生成响应缓存的键；缓存关闭或温度过高（输出不确定）时返回 None"""
+        if self.response_cache_seconds <= 0 or temperature > RESPONSE_CACHE_MAX_TEMPERATURE:
+            return None
+        normalized = _WHITESPACE_RE.sub(' ', prompt).strip()
+        system = _WHITESPACE_RE.sub(' ', system_prompt).strip() if system_prompt else ''
+        return hashlib.sha256(f"{model_name}|{temperature}|{system}|{normalized}".encode('utf-8')).hexdigest()
+
+    def _cache_get(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """命中且未过期时返回缓存结果的副本"""
+        if key is None:
+            return None
+        with self._resp_cache_lock:
+            cached = self._resp_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                self._resp_cache.move_to_end(key)
+                self._cache_stats['hits'] += 1
+                return dict(cached[1])
+            if cached:
+                del self._resp_cache[key]
+            self._cache_stats['misses'] += 1
+        return None
+
+    def _cache_put(self, key: Optional[str], result: Dict[str, Any]) -> None:
+        """只缓存成功的结果，超过容量时淘汰最久未使用的条目"""
+        if key is None or not result.get('success'):
+            return
+        with self._resp_cache_lock:
+            self._resp_cache[key] = (time.monotonic() + self.response_cache_seconds, dict(result))
+            self._resp_cache.move_to_end(key)
+            while len(self._resp_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+                self._resp_cache.popitem(last=False)
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """响应缓存的命中/未命中次数及当前条目数"""
+        with self._resp_cache_lock:
+            return {**self._cache_stats, 'size': len(self._resp_cache)}
+
+    def _resolve_model(self, model_type: str,
+                       model_override: Optional[str]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """根据模型类型选择模型，返回 (模型名, None)；未配置模型时返回 (None, 错误结果字典)"""
         if model_type not in ['fast', 'smart']:
             raise ValueError("model_type 必须是 'fast' 或 'smart'")
             
@@ -80,13 +345,13 @@ class LLMClient:
         if not model_name:
             error_msg = f"未配置可用的模型 (model_type={model_type}, override={model_override})"
             self.logger.error(error_msg)
-            return {
+            return None, {
                 'success': False,
                 'error': error_msg,
                 'model': model_override or model_type
             }
 
-        return self._make_request(prompt, model_name, temperature)
+        return model_name, None
 
     def call_fast_model(self, prompt: str, temperature: float = 0.1) -> Dict[str, Any]:
         """
@@ -102,7 +367,114 @@ class LLMClient:
         """
         return self.call_llm(prompt, 'smart', temperature)
 
-    def _make_request(self, prompt: str, model_name: str, temperature: float) -> Dict[str, Any]:
+    def _build_request_data(self, prompt: str, model_name: str, temperature: float,
+                            system_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """构造chat/completions流式请求体，system消息（固定内容）始终在前"""
+        messages = [{"role": "user", "content": prompt}]
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+        return {
+            "model": model_name,
+            "messages": messages,
+            "stream": True,
+            "temperature": temperature,
+        }
+
+    def _parse_stream_chunk(self, line_data: bytes) -> Optional[str]:
+        """解析单个SSE事件，返回其中的增量正文；无正文或无法解析时返回None"""
+        # 不含 "content" 键的chunk（role/finish_reason/usage、纯reasoning片段）不可能带正文，跳过JSON解析
+        if b'"content"' not in line_data:
+            return None
+        try:
+            chunk = _json_loads(line_data)
+        except _JSONDecodeError:
+            # 切片在调用前就会执行，只在DEBUG开启时才构造
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("跳过无法解析的chunk: %s", line_data[:120])
+            return None
+
+        # 每个chunk都会经过这里，正常情况（如末尾的usage chunk、reasoning片段）不再逐条记日志
+        try:
+            choices = chunk.get('choices')
+            if not choices:
+                return None
+
+            # OpenAI兼容接口可能另外返回reasoning_content，只取正文 content
+            return choices[0].get('delta', {}).get('content') or None
+        except Exception as chunk_error:
+            self.logger.warning("Chunk处理异常，已跳过: %s", chunk_error)
+            self.logger.debug("异常chunk详情: %r", chunk, exc_info=True)
+            return None
+
+    def _success_result(self, model_name: str, parts: List[str]) -> Dict[str, Any]:
+        """拼接流式响应片段（只join一次）并生成成功结果"""
+        content = ''.join(parts).strip()
+        self.logger.info("LLM调用完成: %s - %d 个chunks, 响应长度 %d 字符", model_name, len(parts), len(content))
+        
+        return {
+            'success': True,
+            'content': content,
+            'model': model_name,
+            'provider': 'openai_compatible'
+        }
+
+    def _handle_request_error(self, e: Exception, model_name: str,
+                              attempt: int) -> Tuple[Optional[float], Optional[Dict[str, Any]]]:
+        """
+        处理一次请求失败
+        
+        Returns:
+            (重试前的等待秒数, None) 表示应当重试；(None, 错误结果字典) 表示放弃
+        """
+        if isinstance(e, httpx.HTTPStatusError):
+            status_code = e.response.status_code
+            
+            # 尝试读取错误响应体
+            try:
+                error_body = e.response.text
+            except Exception:
+                error_body = "无法读取响应体"
+            
+            # 对于可重试的错误，进行重试
+            if status_code in [429, 502, 503, 504] and attempt < MAX_RETRIES:
+                delay = RETRY_BASE_DELAY * (2 ** attempt)  # 指数退避
+                self.logger.warning(f"LLM API请求失败 ({status_code})，{delay}秒后重试... (尝试 {attempt + 1}/{MAX_RETRIES + 1})")
+                return delay, None
+            error_msg = f"LLM API请求失败: {status_code} - {error_body}"
+            self.logger.error(error_msg)
+            
+        elif isinstance(e, (httpx.ConnectError, httpx.TimeoutException, httpx.ReadError)):
+            # 网络相关错误，可重试
+            if attempt < MAX_RETRIES:
+                delay = RETRY_BASE_DELAY * (2 ** attempt)
+                self.logger.warning(f"网络错误: {str(e)}，{delay}秒后重试... (尝试 {attempt + 1}/{MAX_RETRIES})")
+                return delay, None
+            error_msg = f"网络连接错误: {str(e)}"
+            self.logger.error(error_msg)
+            
+        else:
+            # 其他不可重试的错误
+            error_msg = f"LLM客户端错误: {str(e)}"
+            self.logger.error(error_msg, exc_info=True)
+            
+        return None, {
+            'success': False, 
+            'error': error_msg,
+            'model': model_name
+        }
+
+    def _exhausted_result(self, model_name: str) -> Dict[str, Any]:
+        # 所有重试都失败
+        error_msg = f"经过 {MAX_RETRIES + 1} 次尝试后 LLM 调用仍然失败"
+        self.logger.error(error_msg)
+        return {
+            'success': False,
+            'error': error_msg,
+            'model': model_name
+        }
+
+    def _make_request(self, prompt: str, model_name: str, temperature: float,
+                      system_prompt: Optional[str] = None) -> Dict[str, Any]:
         """
         执行具体的LLM请求，带有重试机制
         
@@ -110,148 +482,97 @@ class LLMClient:
             prompt: 提示词
             model_name: 模型名称
             temperature: 生成温度
+            system_prompt: 可选的system消息
             
         Returns:
             响应结果字典
         """
-        import time
-        
-        # 重试配置
-        max_retries = 3
-        base_delay = 2.0  # 基本延迟秒数
-        
-        for attempt in range(max_retries + 1):
+        for attempt in range(MAX_RETRIES + 1):
             try:
-                self.logger.info(f"调用LLM: {model_name} (尝试 {attempt + 1}/{max_retries + 1})")
-                self.logger.info(f"Prompt长度: {len(prompt)} 字符")
+                # %-格式化：日志级别高于INFO时不会构造消息
+                self.logger.info("调用LLM: %s (尝试 %d/%d), Prompt长度: %d 字符",
+                                 model_name, attempt + 1, MAX_RETRIES + 1, len(prompt))
                 
-                request_data = {
-                    "model": model_name,
-                    "messages": [
-                        {"role": "user", "content": prompt}
-                    ],
-                    "stream": True,
-                    "temperature": temperature,
-                }
-
-                full_response_content = ""
-                chunk_count = 0
+                request_data = self._build_request_data(prompt, model_name, temperature, system_prompt)
+                parts = []
                 
-                self.logger.debug("开始streaming响应处理...")
-                with self.http_client.stream("POST", "/chat/completions", json=request_data) as response:
+                with self.http_client.stream("POST", "/chat/completions", json=request_data,
+                                             headers=_STREAM_HEADERS) as response:
                     # 检查响应状态
                     if response.status_code != 200:
                         response.raise_for_status()
                     
-                    # 处理流式响应
-                    for line in response.iter_text():
-                        if not line.strip():
-                            continue
-
-                        for sub_line in line.split('\n'):
-                            if not sub_line.startswith('data: '):
-                                continue
-
-                            line_data = sub_line[len('data: '):]
-                            if line_data.strip() == '[DONE]':
-                                break
-
-                            try:
-                                chunk = json.loads(line_data)
-                            except json.JSONDecodeError:
-                                self.logger.debug("跳过无法解析的chunk: %s", line_data[:120])
-                                continue
-
-                            try:
-                                choices = chunk.get('choices') or []
-                                if not choices:
-                                    self.logger.debug("跳过缺少choices的chunk: %s", chunk)
-                                    continue
-
-                                delta = choices[0].get('delta', {}) if choices else {}
-
-                                # OpenAI兼容接口可能返回reasoning_content，需要跳过
-                                reasoning_content = delta.get('reasoning_content')
-                                if reasoning_content:
-                                    self.logger.debug("收到reasoning片段，长度%s，已忽略", len(reasoning_content))
-
-                                content_part = delta.get('content')
-                                if content_part:
-                                    full_response_content += content_part
-                                    chunk_count += 1
-                            except Exception as chunk_error:
-                                self.logger.warning("Chunk处理异常，已跳过: %s", chunk_error)
-                                self.logger.debug("异常chunk详情: %r", chunk, exc_info=True)
-                                continue
-
-                self.logger.info(f"LLM调用完成 - 处理了 {chunk_count} 个chunks")
-                self.logger.info(f"响应内容长度: {len(full_response_content)} 字符")
-                
-                return {
-                    'success': True,
-                    'content': full_response_content.strip(),
-                    'model': model_name,
-                    'provider': 'openai_compatible'
-                }
-
-            except httpx.HTTPStatusError as e:
-                status_code = e.response.status_code
+                    # 处理流式响应：按字节读取并自行切分SSE行
+                    for line_data in _iter_sse_payloads(response.iter_bytes(STREAM_CHUNK_SIZE)):
+                        content_part = self._parse_stream_chunk(line_data)
+                        if content_part:
+                            parts.append(content_part)
+
+                return self._success_result(model_name, parts)
+
+            except Exception as e:
+                delay, error_result = self._handle_request_error(e, model_name, attempt)
+                if error_result is not None:
+                    return error_result
+                time.sleep(delay)
+        
+        return self._exhausted_result(model_name)
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        获取绑定在当前事件循环上的异步客户端
+        
+        异步连接池不能跨事件循环使用，在新的事件循环中调用时会重新创建。
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                **self._client_kwargs,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    async def _make_request_async(self, prompt: str, model_name: str, temperature: float,
+                                  system_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """_make_request 的异步版本，等待网络时不阻塞事件循环"""
+        client = self._get_async_client()
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                # %-格式化：日志级别高于INFO时不会构造消息
+                self.logger.info("调用LLM: %s (尝试 %d/%d), Prompt长度: %d 字符",
+                                 model_name, attempt + 1, MAX_RETRIES + 1, len(prompt))
                 
-                # 尝试读取错误响应体
-                try:
-                    error_body = e.response.text
-                except Exception:
-                    error_body = "无法读取响应体"
+                request_data = self._build_request_data(prompt, model_name, temperature, system_prompt)
+                parts = []
                 
-                # 对于可重试的错误，进行重试
-                if status_code in [429, 502, 503, 504] and attempt < max_retries:
-                    delay = base_delay * (2 ** attempt)  # 指数退避
-                    self.logger.warning(f"LLM API请求失败 ({status_code})，{delay}秒后重试... (尝试 {attempt + 1}/{max_retries + 1})")
-                    time.sleep(delay)
-                    continue
-                else:
-                    error_msg = f"LLM API请求失败: {status_code} - {error_body}"
-                    self.logger.error(error_msg)
-                    return {
-                        'success': False, 
-                        'error': error_msg,
-                        'model': model_name
-                    }
-                    
-            except (httpx.ConnectError, httpx.TimeoutException, httpx.ReadError) as e:
-                # 网络相关错误，可重试
-                if attempt < max_retries:
-                    delay = base_delay * (2 ** attempt)
-                    self.logger.warning(f"网络错误: {str(e)}，{delay}秒后重试... (尝试 {attempt + 1}/{max_retries})")
-                    time.sleep(delay)
-                    continue
-                else:
-                    error_msg = f"网络连接错误: {str(e)}"
-                    self.logger.error(error_msg)
-                    return {
-                        'success': False, 
-                        'error': error_msg,
-                        'model': model_name
-                    }
+                async with client.stream("POST", "/chat/completions", json=request_data,
+                                         headers=_STREAM_HEADERS) as response:
+                    if response.status_code != 200:
+                        response.raise_for_status()
                     
+                    async for line_data in _aiter_sse_payloads(response.aiter_bytes(STREAM_CHUNK_SIZE)):
+                        content_part = self._parse_stream_chunk(line_data)
+                        if content_part:
+                            parts.append(content_part)
+
+                return self._success_result(model_name, parts)
+
             except Exception as e:
-                # 其他不可重试的错误
-                error_msg = f"LLM客户端错误: {str(e)}"
-                self.logger.error(error_msg, exc_info=True)
-                return {
-                    'success': False, 
-                    'error': error_msg,
-                    'model': model_name
-                }
+                delay, error_result = self._handle_request_error(e, model_name, attempt)
+                if error_result is not None:
+                    return error_result
+                await asyncio.sleep(delay)
         
-        # 所有重试都失败
-        error_msg = f"经过 {max_retries + 1} 次尝试后 LLM 调用仍然失败"
-        self.logger.error(error_msg)
-        return {
-            'success': False,
-            'error': error_msg,
-            'model': model_name
-        }
+        return self._exhausted_result(model_name)
+
+    async def aclose(self):
+        """关闭异步客户端（需在创建它的事件循环中调用）"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
 
     def extract_json_from_response(self, response_content: str) -> Optional[Dict[str, Any]]:
         """
@@ -265,30 +586,25 @@ class LLMClient:
         """
         # 尝试直接解析
         try:
-            return json.loads(response_content.strip())
-        except json.JSONDecodeError:
+            return _json_loads(response_content.strip())
+        except _JSONDecodeError:
             pass
         
         # 尝试提取代码块中的JSON
-        import re
-        json_pattern = r'```json\s*(.*?)\s*```'
-        match = re.search(json_pattern, response_content, re.DOTALL | re.IGNORECASE)
+        match = _JSON_FENCE_RE.search(response_content)
         
         if match:
             try:
-                return json.loads(match.group(1).strip())
-            except json.JSONDecodeError:
+                return _json_loads(match.group(1).strip())
+            except _JSONDecodeError:
                 pass
         
-        # 尝试提取花括号内的内容
-        brace_pattern = r'\{.*\}'
-        match = re.search(brace_pattern, response_content, re.DOTALL)
-        
-        if match:
+        # 尝试提取花括号配平的对象，返回第一个能解析的
+        for candidate in _iter_json_objects(response_content):
             try:
-                return json.loads(match.group(0))
-            except json.JSONDecodeError:
-                pass
+                return _json_loads(candidate)
+            except _JSONDecodeError:
+                continue
         
         self.logger.warning("无法从LLM响应中提取有效JSON")
         return None
@@ -307,20 +623,7 @@ class LLMClient:
     @staticmethod
     def get_model_display_name(model_name: Optional[str]) -> str:
         """为模型名称生成友好的展示名称"""
-        if not model_name:
-            return 'LLM'
-
-        lower_name = model_name.lower()
-        if 'gemini' in lower_name:
-            return 'Gemini'
-        if 'glm' in lower_name and '4.5' in lower_name:
-            return 'GLM4.5'
-        if 'glm' in lower_name:
-            return 'GLM'
-        if 'gpt' in lower_name and '4' in lower_name:
-            return 'GPT-4'
-
-        return model_name
+        return _model_display_name(model_name)
 
 
 # 创建全局LLM客户端实例
@@ -328,10 +631,14 @@ def get_llm_client() -> Optional[LLMClient]:
     """获取LLM客户端实例（带缓存）"""
     global _cached_llm_client
 
-    try:
-        if _cached_llm_client is None:
-            _cached_llm_client = LLMClient()
+    # 双重检查：已创建时无需加锁；并发的分析线程只会创建一个实例
+    if _cached_llm_client is not None:
         return _cached_llm_client
+    try:
+        with _llm_client_lock:
+            if _cached_llm_client is None:
+                _cached_llm_client = LLMClient()
+            return _cached_llm_client
     except Exception as e:
         logger.warning(f"LLM客户端初始化失败: {e}")
         _cached_llm_client = None
@@ -351,7 +658,8 @@ def call_llm(
     prompt: str,
     model_type: str = 'fast',
     temperature: float = 0.3,
-    model_override: Optional[str] = None
+    model_override: Optional[str] = None,
+    system_prompt: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     便捷的LLM调用函数
@@ -360,6 +668,7 @@ def call_llm(
         prompt: 提示词
         model_type: 模型类型 ('fast' 或 'smart')
         temperature: 生成温度
+        system_prompt: 可选的固定指令，作为system消息放在最前面
         
     Returns:
         LLM响应结果
@@ -368,8 +677,62 @@ def call_llm(
     if not client:
         return {'success': False, 'error': 'LLM客户端初始化失败'}
     
-    return client.call_llm(prompt, model_type, temperature, model_override=model_override)
+    return client.call_llm(prompt, model_type, temperature, model_override=model_override,
+                           system_prompt=system_prompt)
+
+
+async def acall_llm(
+    prompt: str,
+    model_type: str = 'fast',
+    temperature: float = 0.3,
+    model_override: Optional[str] = None,
+    system_prompt: Optional[str] = None
+) -> Dict[str, Any]:
+    """便捷的异步LLM调用函数，参数同 call_llm"""
+    client = get_llm_client()
+    if not client:
+        return {'success': False, 'error': 'LLM客户端初始化失败'}
+    
+    return await client.acall_llm(prompt, model_type, temperature, model_override=model_override,
+                                  system_prompt=system_prompt)
+
+
+async def batch_call_llm(
+    prompts: List[str],
+    model_type: str = 'fast',
+    temperature: float = 0.3,
+    model_override: Optional[str] = None,
+    concurrency: int = 8,
+    system_prompt: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    并发调用LLM处理一批提示词，同时在途的请求数不超过 concurrency
+    
+    Args:
+        prompts: 提示词列表
+        model_type: 模型类型 ('fast' 或 'smart')
+        temperature: 生成温度
+        model_override: 指定模型名称（覆盖 model_type）
+        concurrency: 最大并发请求数
+        system_prompt: 所有提示词共享的固定指令（作为system消息，可命中服务端前缀缓存）
+        
+    Returns:
+        与 prompts 顺序一致的响应结果列表
+    """
+    client = get_llm_client()
+    if not client:
+        return [{'success': False, 'error': 'LLM客户端初始化失败'} for _ in prompts]
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _call_one(prompt: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await client.acall_llm(prompt, model_type, temperature, model_override=model_override,
+                                          system_prompt=system_prompt)
+
+    return list(await asyncio.gather(*(_call_one(prompt) for prompt in prompts)))
 
 
 # 缓存的全局客户端实例
 _cached_llm_client: Optional[LLMClient] = None
+_llm_client_lock = threading.Lock()
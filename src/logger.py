@@ -2,6 +2,7 @@
 日志配置模块
 """
 import logging
+import logging.handlers
 import sys
 import time
 from datetime import datetime
@@ -26,8 +27,13 @@ def setup_logging():
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
-    # 文件处理器
-    file_handler = logging.FileHandler(log_config['log_file'], encoding='utf-8')
+    # 文件处理器：按大小轮转，避免日志文件无限增长
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_config['log_file'],
+        maxBytes=log_config['log_max_bytes'],
+        backupCount=log_config['log_backup_count'],
+        encoding='utf-8'
+    )
     file_handler.setFormatter(formatter)
     
     # 控制台处理器
@@ -6,10 +6,9 @@ import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone, timedelta
 import json
-import pymysql
 
 from .config import config
-from .database import DatabaseManager
+from .database import DatabaseManager, db_driver
 from .notion_client import get_notion_client
 
 logger = logging.getLogger(__name__)
@@ -45,7 +44,7 @@ class ProductCatalogGenerator:
         """
         try:
             with self.db_manager.get_connection() as conn:
-                with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+                with conn.cursor(db_driver.cursors.DictCursor) as cursor:
                     # 构建时间筛选条件
                     time_filter = ""
                     params_discovered = []
@@ -72,13 +71,13 @@ class ProductCatalogGenerator:
                         FROM discovered_products dp1
                         INNER JOIN (
                             SELECT
-                                LOWER(TRIM(product_name)) as normalized_name,
+                                product_name_norm as normalized_name,
                                 MAX(created_at) as latest_created_at
                             FROM discovered_products
                             {time_filter}
-                            GROUP BY LOWER(TRIM(product_name))
+                            GROUP BY product_name_norm
                         ) dp2
-                        ON LOWER(TRIM(dp1.product_name)) = dp2.normalized_name
+                        ON dp1.product_name_norm = dp2.normalized_name
                         AND dp1.created_at = dp2.latest_created_at
                         ORDER BY dp1.created_at DESC
                     """
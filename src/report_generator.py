@@ -161,36 +161,33 @@ class TechNewsReportGenerator:
 
             # 将报告存入数据库
             try:
-                with self.db_manager.get_connection() as conn:
-                    with conn.cursor() as cursor:
-                        insert_sql = """
-                            INSERT INTO technews_reports (
-                                report_uuid, generated_at, report_date, 
-                                time_range, article_count, main_topics, 
-                                report_content_md, metadata
-                            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                        """
-                        
-                        cursor.execute(insert_sql, (
-                            report_uuid,
-                            beijing_time,
-                            report_date,
-                            time_range_str,
-                            article_count,
-                            json.dumps([], ensure_ascii=False),  # 主题信息可以从内容中提取
-                            full_report_md,
-                            json.dumps(metadata, ensure_ascii=False)
-                        ))
-                        
-                        conn.commit()
-                        logger.info(f"报告已成功存入数据库 - UUID: {report_uuid}")
-
-                        # 推送到 Notion
-                        notion_result = self._push_to_notion(
-                            full_report_md,
-                            report_uuid,
-                            model_display=model_info.get('model_display') if model_info else None
-                        )
+                with self.db_manager.session() as cursor:
+                    insert_sql = """
+                        INSERT INTO technews_reports (
+                            report_uuid, generated_at, report_date, 
+                            time_range, article_count, main_topics, 
+                            report_content_md, metadata
+                        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                    """
+                    
+                    cursor.execute(insert_sql, (
+                        report_uuid,
+                        beijing_time,
+                        report_date,
+                        time_range_str,
+                        article_count,
+                        json.dumps([], ensure_ascii=False),  # 主题信息可以从内容中提取
+                        full_report_md,
+                        json.dumps(metadata, ensure_ascii=False)
+                    ))
+                logger.info(f"报告已成功存入数据库 - UUID: {report_uuid}")
+
+                # 推送到 Notion（提交后再推送，不占用数据库连接）
+                notion_result = self._push_to_notion(
+                    full_report_md,
+                    report_uuid,
+                    model_display=model_info.get('model_display') if model_info else None
+                )
 
             except Exception as e:
                 logger.error(f"存储报告到数据库失败: {e}")
@@ -117,6 +117,80 @@ def _normalize_items_for_db(items: List[Dict[str, Any]], table_name: str) -> Lis
         normalized_items.append(normalized_item)
     return normalized_items
 
+
+def _fetch_indiehackers_feeds(feeds: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    获取所有Indie Hackers源的条目：先逐个走RSS，
+    RSS失败的源汇总成一个任务列表，由爬虫共用一个浏览器并发回退抓取。
+    """
+    product_types = ['alltime', 'month', 'week', 'today']
+    group_types = ['growth', 'developers', 'saas']
+
+    feed_items = {}
+    jobs = []
+    job_feeds = []
+    for feed_name, feed_config in feeds.items():
+        feed_type = feed_name.replace('indiehackers_', '')
+        logger.info(f"Attempting to fetch Indie Hackers feed '{feed_name}' via RSS.")
+        feed_items[feed_name] = rss_parser.parse_feed(feed_config)
+
+        # rss_parser returns [] on error. If items is empty, queue the fallback scraper.
+        if feed_items[feed_name]:
+            continue
+        logger.warning(f"RSS feed for '{feed_name}' returned no items or failed to parse. Falling back to web scraper.")
+        if feed_type in product_types:
+            # The scraper's period for 'alltime' is 'all-time'
+            jobs.append(('products', 'all-time' if feed_type == 'alltime' else feed_type))
+            job_feeds.append(feed_name)
+        elif feed_type in group_types:
+            # The scraper's group name for 'saas' is 'saas-marketing'
+            jobs.append(('group', 'saas-marketing' if feed_type == 'saas' else feed_type))
+            job_feeds.append(feed_name)
+
+    if not jobs:
+        return feed_items
+
+    # 使用nest_asyncio来处理嵌套事件循环
+    try:
+        import nest_asyncio
+        nest_asyncio.apply()
+    except ImportError:
+        pass  # 如果没有nest_asyncio，继续尝试
+
+    async def _scrape():
+        try:
+            return await indiehackers_scraper.scrape_many(jobs)
+        finally:
+            # 共享浏览器绑定在本次事件循环上，循环结束前关闭
+            await indiehackers_scraper.close_browser()
+
+    try:
+        scraped = asyncio.run(_scrape())
+    except RuntimeError as e:
+        if "cannot be called from a running event loop" in str(e):
+            # 如果在事件循环中运行，使用同步的方式调用
+            logger.warning("在事件循环中运行，跳过爬虫回滚")
+            scraped = [[] for _ in jobs]
+        else:
+            logger.error(f"Indie Hackers scraper failed: {e}", exc_info=True)
+            scraped = [[] for _ in jobs]
+    except Exception as scraper_e:
+        logger.error(f"Indie Hackers scraper failed: {scraper_e}", exc_info=True)
+        scraped = [[] for _ in jobs]
+
+    for feed_name, items in zip(job_feeds, scraped):
+        if items:
+            logger.info(f"Successfully scraped {len(items)} items for '{feed_name}'.")
+            # Normalize scraped data to match DB schema
+            for item in items:
+                item['guid'] = item.get('link') # Use link as GUID for scraped items
+        else:
+            logger.error(f"Scraper for '{feed_name}' returned no items.")
+        feed_items[feed_name] = items
+
+    return feed_items
+
+
 def run_crawl_task(db_manager: DatabaseManager, feed_to_crawl: str = None) -> Dict[str, Any]:
     """执行爬取任务"""
     logger.info("开始执行RSS爬取任务")
@@ -143,6 +217,16 @@ def run_crawl_task(db_manager: DatabaseManager, feed_to_crawl: str = None) -> Di
             return results
         feeds = {normalized_feed_to_crawl: feeds[normalized_feed_to_crawl]}
 
+    # Indie Hackers源提前统一获取，需要回退爬虫的源共用一次浏览器启动
+    try:
+        indiehackers_items = _fetch_indiehackers_feeds(
+            {name: cfg for name, cfg in feeds.items() if 'indiehackers' in name}
+        )
+    except Exception as e:
+        logger.error(f"获取Indie Hackers源失败: {e}", exc_info=True)
+        results['errors'].append(f"Indie Hackers: {e}")
+        indiehackers_items = {}
+
     for feed_name, feed_config in feeds.items():
         try:
             logger.info(f"处理RSS源: {feed_name}")
@@ -154,52 +238,7 @@ def run_crawl_task(db_manager: DatabaseManager, feed_to_crawl: str = None) -> Di
                 table_name = "rss_indiehackers"
                 feed_type = feed_name.replace('indiehackers_', '')
                 
-                logger.info(f"Attempting to fetch Indie Hackers feed '{feed_name}' via RSS.")
-                items = rss_parser.parse_feed(feed_config)
-
-                # rss_parser returns [] on error. If items is empty, trigger the fallback scraper.
-                if not items:
-                    logger.warning(f"RSS feed for '{feed_name}' returned no items or failed to parse. Falling back to web scraper.")
-                    try:
-                        # The scraper's period for 'alltime' is 'all-time'
-                        scrape_period = 'all-time' if feed_type == 'alltime' else feed_type
-                        # The scraper's group name for 'saas' is 'saas-marketing'
-                        scrape_group = 'saas-marketing' if feed_type == 'saas' else feed_type
-
-                        product_types = ['alltime', 'month', 'week', 'today']
-                        group_types = ['growth', 'developers', 'saas']
-
-                        # 使用nest_asyncio来处理嵌套事件循环
-                        try:
-                            import nest_asyncio
-                            nest_asyncio.apply()
-                        except ImportError:
-                            pass  # 如果没有nest_asyncio，继续尝试
-                        
-                        try:
-                            if feed_type in product_types:
-                                items = asyncio.run(indiehackers_scraper.scrape_products(scrape_period))
-                            elif feed_type in group_types:
-                                items = asyncio.run(indiehackers_scraper.scrape_group(scrape_group))
-                        except RuntimeError as e:
-                            if "cannot be called from a running event loop" in str(e):
-                                # 如果在事件循环中运行，使用同步的方式调用
-                                logger.warning("在事件循环中运行，跳过爬虫回滚")
-                                items = []
-                            else:
-                                raise
-                        
-                        if items:
-                            logger.info(f"Successfully scraped {len(items)} items for '{feed_name}'.")
-                            # Normalize scraped data to match DB schema
-                            for item in items:
-                                item['guid'] = item.get('link') # Use link as GUID for scraped items
-                        else:
-                            logger.error(f"Scraper for '{feed_name}' returned no items.")
-
-                    except Exception as scraper_e:
-                        logger.error(f"Scraper for '{feed_name}' also failed: {scraper_e}", exc_info=True)
-                        items = [] # Ensure items is an empty list if scraper fails too
+                items = indiehackers_items.get(feed_name, [])
             
             elif 'techcrunch' in feed_name:
                 table_name = "rss_techcrunch"
@@ -244,13 +283,13 @@ def run_crawl_task(db_manager: DatabaseManager, feed_to_crawl: str = None) -> Di
 
             # --- 以下为其他RSS源的通用处理逻辑 ---
 
-            # 获取已存在的数据用于去重
-            existing_guids = db_manager.get_existing_guids(table_name)
+            # 只查询本批候选GUID中尚未入库的部分，无需拉取整表GUID
+            new_guids = db_manager.get_new_guids(table_name, [item['guid'] for item in items])
 
             # 过滤新条目并添加feed_type
             new_items = []
             for item in items:
-                if item['guid'] not in existing_guids:
+                if item['guid'] in new_guids:
                     if feed_type:
                         item['feed_type'] = feed_type
                     new_items.append(item)
@@ -356,15 +395,17 @@ def run_stats_task(db_manager: DatabaseManager) -> Dict[str, Any]:
         'decohack': 'rss_decohack_products'
     }
 
-    for feed_key, table_name in tables_to_stats.items():
-        try:
-            stats = db_manager.get_stats(table_name)
+    try:
+        # 所有表的统计在一次查询中完成
+        all_stats = db_manager.get_all_stats(list(tables_to_stats.values()))
+        for feed_key, table_name in tables_to_stats.items():
+            stats = all_stats[table_name]
             results['stats'][feed_key] = stats
             logger.info(f"{feed_key}: {stats}")
-        except Exception as e:
-            logger.error(f"获取 {feed_key} 统计信息失败: {e}")
-            results['success'] = False
-            results['error'] = str(e)
+    except Exception as e:
+        logger.error(f"获取统计信息失败: {e}")
+        results['success'] = False
+        results['error'] = str(e)
 
     # 为indiehackers添加按feed_type的统计
     try:
@@ -378,15 +419,14 @@ def run_stats_task(db_manager: DatabaseManager) -> Dict[str, Any]:
 def _get_indiehackers_stats_by_type(db_manager: DatabaseManager) -> Dict[str, Any]:
     """获取indiehackers按feed_type的统计"""
     try:
-        with db_manager.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT feed_type, COUNT(*) as count
-                    FROM rss_indiehackers
-                    GROUP BY feed_type
-                """)
-                results = cursor.fetchall()
-                return {row[0]: row[1] for row in results}
+        with db_manager.session() as cursor:
+            cursor.execute("""
+                SELECT feed_type, COUNT(*) as count
+                FROM rss_indiehackers
+                GROUP BY feed_type
+            """)
+            results = cursor.fetchall()
+            return {row[0]: row[1] for row in results}
     except Exception as e:
         logger.error(f"获取indiehackers分类统计失败: {e}")
         return {}
@@ -948,10 +988,6 @@ def run_weibo_crawl_task(db_manager: DatabaseManager) -> Dict[str, Any]:
 
         logger.info(f"配置检查完成 - 用户数: {len(user_ids)}, 前缀数: {len(prefixes)}")
 
-        # 获取已存在的GUID集合用于去重
-        existing_guids = db_manager.get_existing_guids('rss_weibo')
-        logger.info(f"数据库中已存在 {len(existing_guids)} 条微博记录")
-
         # 对每个用户ID进行爬取
         all_new_items = []
         for user_id in user_ids:
@@ -962,8 +998,9 @@ def run_weibo_crawl_task(db_manager: DatabaseManager) -> Dict[str, Any]:
                 items = rss_parser.fetch_weibo_rss(user_id, prefixes, max_retries=5)
 
                 if items:
-                    # 过滤新条目
-                    new_items = [item for item in items if item['guid'] not in existing_guids]
+                    # 过滤新条目（只查询本批候选GUID）
+                    new_guids = db_manager.get_new_guids('rss_weibo', [item['guid'] for item in items])
+                    new_items = [item for item in items if item['guid'] in new_guids]
 
                     if new_items:
                         logger.info(f"微博用户 {user_id}: 获取到 {len(items)} 条，其中 {len(new_items)} 条为新微博")